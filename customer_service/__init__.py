@@ -1,17 +1,27 @@
 """Includes all shared libraries for the agent."""
 
 import os
+import warnings
 
 import google.auth
 from dotenv import load_dotenv
 
+# Installed before any submodule is imported so it also covers the warnings
+# pydantic raises while the tool and datamodel modules are being loaded.
+warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
+
 load_dotenv()
 
-_, project_id = google.auth.default()
-os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
+# Resolving application default credentials can hit the metadata server, so
+# only do it when the project isn't configured already.
+if not os.environ.get("GOOGLE_CLOUD_PROJECT"):
+    _, project_id = google.auth.default()
+    if project_id:
+        os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "global")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
-from . import agent
+# Imported last so ADK and the GenAI client see the environment set above.
+from . import agent  # noqa: E402
 
 __all__ = ["agent"]
@@ -1,5 +1,6 @@
 """Configuration module for the customer service agent."""
 
+import functools
 import logging
 import os
 
@@ -32,3 +33,9 @@ class Config(BaseSettings):
     CLOUD_LOCATION: str = Field(default="us-central1")
     GENAI_USE_VERTEXAI: str = Field(default="1")
     API_KEY: str | None = Field(default="")
+
+
+@functools.cache
+def get_config() -> Config:
+    """Return the process-wide Config, reading the environment only once."""
+    return Config()
@@ -2,52 +2,331 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import contextvars
+import functools
+import os
+import queue
 import sqlite3
-from contextlib import contextmanager
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 DB_PATH = Path(__file__).parent / "customer_service.db"
 
 DEFAULT_CUSTOMER_ID = "cust-1"
 
+READER_POOL_SIZE = 4
+
+# Offloaded tool calls running at once, across all sessions. ADK already fans
+# out sibling function calls; this caps how many of them hold a thread.
+TOOL_CONCURRENCY_LIMIT = int(os.environ.get("TOOL_CONCURRENCY_LIMIT", "4"))
+
+# Bump whenever the schema changes; bootstrap() rebuilds older databases.
+SCHEMA_VERSION = 2
+
+# Memory-map up to this many bytes of the file so reads skip read() syscalls.
+MMAP_SIZE = 256 * 1024 * 1024
+
+# sqlite3 keeps an LRU of compiled statements per connection, keyed by SQL text.
+CACHED_STATEMENTS = 256
+
+# Queries shared by several tools. Reader connections compile them up front.
+# Each projects only the columns its callers read.
+SQL_ORDER_BY_ID = "SELECT id, date, total, items FROM orders WHERE id = ?"
+SQL_CUSTOMER_EXISTS = "SELECT 1 FROM customers WHERE id = ? AND deleted = FALSE"
+SQL_PAYMENT_METHODS_BY_CUSTOMER = (
+    "SELECT id, brand, last4, exp_month, exp_year, token"
+    " FROM payment_methods WHERE customer_id = ?"
+)
+SQL_ORDERS_BY_CUSTOMER = (
+    "SELECT id, date, total, items FROM orders WHERE customer_id = ? ORDER BY date DESC"
+)
+
+# One row per customer with every child relation folded into a JSON array.
+# Correlated subqueries keep the relations independent, where chained LEFT
+# JOINs would multiply addresses x payment methods. Orders are not part of the
+# record; the order tools query them directly.
+SQL_CUSTOMER_BUNDLE = """
+SELECT c.*,
+    (SELECT json_group_array(reward) FROM loyalty_rewards
+        WHERE customer_id = c.id) AS rewards_json,
+    (SELECT json_group_array(json_object(
+            'id', id, 'line1', line1, 'line2', line2, 'city', city,
+            'state', state, 'postal_code', postal_code, 'country', country))
+        FROM addresses WHERE customer_id = c.id) AS addresses_json,
+    (SELECT json_group_array(json_object(
+            'id', id, 'brand', brand, 'last4', last4, 'exp_month', exp_month,
+            'exp_year', exp_year, 'token', token))
+        FROM payment_methods WHERE customer_id = c.id) AS payment_methods_json
+FROM customers c
+WHERE c.id = ? AND c.deleted = FALSE
+"""
+
+_PREPARED_QUERIES = (
+    SQL_ORDER_BY_ID,
+    SQL_CUSTOMER_EXISTS,
+    SQL_PAYMENT_METHODS_BY_CUSTOMER,
+    SQL_ORDERS_BY_CUSTOMER,
+    SQL_CUSTOMER_BUNDLE,
+)
+
+
+def _make_conn(readonly: bool = False) -> sqlite3.Connection:
+    """Open a long-lived connection with the pool's PRAGMAs applied."""
+    conn = sqlite3.connect(
+        str(DB_PATH),
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    if readonly:
+        conn.execute("PRAGMA query_only=TRUE")
+        # Warm the statement cache so the first tool call skips parse/plan.
+        for sql in _PREPARED_QUERIES:
+            conn.execute(sql, (None,)).fetchall()
+    return conn
+
+
+class _ConnectionPool:
+    """Bounded pool of long-lived connections, opened lazily up to `size`."""
 
-def dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
-    """Convert SQLite row to dictionary."""
-    fields = [column[0] for column in cursor.description]
-    return {key: value for key, value in zip(fields, row)}
+    def __init__(self, size: int, readonly: bool = False):
+        self.size = size
+        self.readonly = readonly
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while below `size`."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                return _make_conn(self.readonly)
+        return self._idle.get()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, discarding any open transaction."""
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
+# WAL lets the reader connections run alongside the single writer.
+_READERS = _ConnectionPool(READER_POOL_SIZE, readonly=True)
+_WRITER = _ConnectionPool(1)
+
+_write_generation = 0
+
+# Writer connection of the transaction() block running in this context, if any.
+_active_writer: contextvars.ContextVar[sqlite3.Connection | None] = (
+    contextvars.ContextVar("_active_writer", default=None)
+)
+
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TOOL_CONCURRENCY_LIMIT, thread_name_prefix="tool"
+)
+
+
+@atexit.register
+def close_pool():
+    """Close every idle pooled connection."""
+    _READERS.close()
+    _WRITER.close()
 
 
 @contextmanager
-def get_db():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = dict_factory
+def get_db(readonly: bool = True):
+    """Context manager for database connections.
+
+    Connections are borrowed from a process-wide pool and returned on exit, so
+    SQLite's page cache and PRAGMA settings survive across calls. Read-only
+    callers share a pool of `query_only` connections; pass `readonly=False` to
+    borrow the single writer connection. Inside `transaction()`, writer
+    checkouts reuse the transaction's connection.
+    """
+    global _write_generation
+    if not readonly and (active := _active_writer.get()) is not None:
+        yield active
+        return
+    pool = _READERS if readonly else _WRITER
+    conn = pool.acquire()
+    changes = conn.total_changes
     try:
         yield conn
     finally:
-        conn.close()
+        if conn.total_changes != changes:
+            _write_generation += 1
+        pool.release(conn)
+
+
+@contextmanager
+def transaction():
+    """Run every writer checkout in the block as one IMMEDIATE transaction.
+
+    Commits when the block exits normally and rolls back if it raises.
+    """
+    with get_db(readonly=False) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        token = _active_writer.set(conn)
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            _active_writer.reset(token)
+
+
+def write_generation() -> int:
+    """Return a counter that moves whenever a writer checkout changed rows.
+
+    In-process caches of database reads include it in their keys, so any write
+    invalidates them without each tool having to know what it affects.
+    """
+    return _write_generation
+
+
+def cached_read(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Memoize a read-only, database-backed tool until the next write.
+
+    Results are keyed by the tool's arguments and `write_generation()`, so a
+    repeat lookup within a turn skips the database while any write through
+    `get_db` invalidates every entry. Arguments must be hashable, and callers
+    must treat the shared result as read-only.
+    """
+
+    @functools.lru_cache(maxsize=256)
+    def cached(generation: int, *args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return cached(_write_generation, *args, **kwargs)
+
+    return wrapper
+
+
+def offload(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a blocking, database-backed tool so it runs in a worker thread.
+
+    ADK awaits coroutine tools on its event loop, so offloaded tools no longer
+    stall other sessions (or sibling tool calls) while SQLite does I/O. Calls
+    share a pool of `TOOL_CONCURRENCY_LIMIT` threads. The wrapper keeps the
+    tool's name, docstring and signature for schema building.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Like asyncio.to_thread, carry the caller's context (trace spans).
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(_TOOL_EXECUTOR, call)
+
+    return wrapper
+
+
+@cached_read
+def fetch_order(order_id: str) -> sqlite3.Row | None:
+    """Load one order row, or None if it does not exist.
+
+    Order tools often look up the same order several times in a turn; rows
+    are immutable, so the cached row is shared until the next write.
+    """
+    with get_db() as conn:
+        return conn.execute(SQL_ORDER_BY_ID, (order_id,)).fetchone()
+
+
+def fetch_customer_bundle(customer_id: str) -> dict[str, Any] | None:
+    """Load a customer and all of its child rows in a single query.
+
+    Returns the customer's columns plus decoded `rewards`, `addresses` and
+    `payment_methods` lists, or None if no active customer matches.
+    """
+    with get_db() as conn:
+        row = conn.execute(SQL_CUSTOMER_BUNDLE, (customer_id,)).fetchone()
+    if row is None:
+        return None
+    bundle = dict(row)
+    for relation in ("rewards", "addresses", "payment_methods"):
+        bundle[relation] = orjson.loads(bundle.pop(f"{relation}_json"))
+    return bundle
 
 
 def init_db():
     """Initialize the database schema."""
-    with get_db() as conn:
+    with get_db(readonly=False) as conn:
         cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA wal_autocheckpoint=1000")
+        cursor.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
 
         # Create customers table
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS customers (
             id TEXT PRIMARY KEY,
             email TEXT UNIQUE NOT NULL,
-            profile JSON,
-            loyalty JSON,
-            subscriptions JSON,
-            communication_preferences JSON,
+            first_name TEXT NOT NULL DEFAULT '',
+            last_name TEXT NOT NULL DEFAULT '',
+            phone TEXT,
+            birthdate TEXT,
+            account_number TEXT,
+            customer_start_date TEXT,
+            loyalty_points INTEGER NOT NULL DEFAULT 0,
+            loyalty_tier TEXT NOT NULL DEFAULT 'bronze',
+            language TEXT NOT NULL DEFAULT 'en',
+            currency TEXT NOT NULL DEFAULT 'USD',
+            notifications BOOLEAN,
+            time_zone TEXT,
+            marketing_opt_in BOOLEAN NOT NULL DEFAULT TRUE,
+            newsletters_opt_in BOOLEAN,
+            product_updates_opt_in BOOLEAN,
+            comm_email BOOLEAN NOT NULL DEFAULT TRUE,
+            comm_sms BOOLEAN NOT NULL DEFAULT TRUE,
+            comm_push BOOLEAN NOT NULL DEFAULT TRUE,
             locked BOOLEAN DEFAULT FALSE,
             deleted BOOLEAN DEFAULT FALSE
         )
         """)
 
+        # Create loyalty_rewards table
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS loyalty_rewards (
+            customer_id TEXT NOT NULL,
+            reward TEXT NOT NULL,
+            PRIMARY KEY (customer_id, reward),
+            FOREIGN KEY (customer_id) REFERENCES customers(id)
+        )
+        """)
+
         # Create addresses table
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS addresses (
@@ -89,120 +368,169 @@ def init_db():
         )
         """)
 
+        # Index the customer_id lookups every tool filters on
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_orders_customer_date ON orders(customer_id, date DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_addresses_customer ON addresses(customer_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pm_customer ON payment_methods(customer_id)"
+        )
+
         conn.commit()
 
 
+def _dumps(obj: Any) -> str:
+    """Encode `obj` as JSON text for a JSON column."""
+    return orjson.dumps(obj).decode()
+
+
+SAMPLE_CUSTOMERS = [
+    (
+        DEFAULT_CUSTOMER_ID,
+        "alice@example.com",
+        "Alice",
+        "Example",
+        "A123456",
+        "2023-01-15",
+        120,
+        "silver",
+        True,
+        True,
+        True,
+        True,
+    ),
+]
+
+SAMPLE_LOYALTY_REWARDS = [
+    (DEFAULT_CUSTOMER_ID, "5%_off_next_purchase"),
+]
+
+SAMPLE_ADDRESSES = [
+    (
+        "addr-1",
+        DEFAULT_CUSTOMER_ID,
+        "123 Garden Lane",
+        "Greenfield",
+        "CA",
+        "90210",
+        "USA",
+    ),
+]
+
+SAMPLE_PAYMENT_METHODS = [
+    ("pm-1", DEFAULT_CUSTOMER_ID, "Visa", "4242", 12, 2026),
+]
+
+SAMPLE_ORDERS = [
+    (
+        "ord-1",
+        DEFAULT_CUSTOMER_ID,
+        "2024-06-01",
+        39.43,
+        _dumps(
+            [
+                {
+                    "product_id": "123",
+                    "name": "VP Vinyl Record - The Best of 80s",
+                    "quantity": 1,
+                    "unit_price": 25.98,
+                },
+                {
+                    "product_id": "2o972",
+                    "name": "Louis Armstrong Greatest Hits - CD",
+                    "quantity": 1,
+                    "unit_price": 13.45,
+                },
+            ]
+        ),
+    ),
+]
+
+
 def populate_sample_data():
-    """Populate the database with sample data."""
-    with get_db() as conn:
+    """Populate the database with sample data in a single transaction."""
+    with get_db(readonly=False) as conn, conn:
         cursor = conn.cursor()
+        cursor.execute("BEGIN")
 
-        # Add a sample customer
-        cursor.execute(
-            f"""
+        cursor.executemany(
+            """
         INSERT OR IGNORE INTO customers (
-            id, email, profile, loyalty, subscriptions, communication_preferences, locked, deleted
-        ) VALUES (
-            '{DEFAULT_CUSTOMER_ID}',
-            'alice@example.com',
-            ?,
-            ?,
-            ?,
-            ?,
-            FALSE,
-            FALSE
+            id, email, first_name, last_name, account_number, customer_start_date,
+            loyalty_points, loyalty_tier, marketing_opt_in,
+            comm_email, comm_sms, comm_push, locked, deleted
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, FALSE, FALSE)
+        """,
+            SAMPLE_CUSTOMERS,
         )
+
+        cursor.executemany(
+            """
+        INSERT OR IGNORE INTO loyalty_rewards (customer_id, reward) VALUES (?, ?)
         """,
-            (
-                json.dumps(
-                    {
-                        "first_name": "Alice",
-                        "last_name": "Example",
-                        "account_number": "A123456",
-                        "customer_start_date": "2023-01-15",
-                    }
-                ),
-                json.dumps(
-                    {
-                        "points": 120,
-                        "tier": "silver",
-                        "rewards": ["5%_off_next_purchase"],
-                    }
-                ),
-                json.dumps({"marketing": True}),
-                json.dumps({"email": True, "sms": True, "push_notifications": True}),
-            ),
+            SAMPLE_LOYALTY_REWARDS,
         )
 
-        # Add sample address
-        cursor.execute("""
+        cursor.executemany(
+            """
         INSERT OR IGNORE INTO addresses (
             id, customer_id, line1, city, state, postal_code, country
-        ) VALUES (
-            'addr-1',
-            'cust-1',
-            '123 Garden Lane',
-            'Greenfield',
-            'CA',
-            '90210',
-            'USA'
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            SAMPLE_ADDRESSES,
         )
-        """)
 
-        # Add sample payment method
-        cursor.execute("""
+        cursor.executemany(
+            """
         INSERT OR IGNORE INTO payment_methods (
             id, customer_id, brand, last4, exp_month, exp_year
-        ) VALUES (
-            'pm-1',
-            'cust-1',
-            'Visa',
-            '4242',
-            12,
-            2026
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            SAMPLE_PAYMENT_METHODS,
         )
-        """)
 
-        # Add sample order
-        cursor.execute(
+        cursor.executemany(
             """
         INSERT OR IGNORE INTO orders (
             id, customer_id, date, total, items
-        ) VALUES (
-            'ord-1',
-            'cust-1',
-            '2024-06-01',
-            39.43,
-            ?
-        )
+        ) VALUES (?, ?, ?, ?, ?)
         """,
-            (
-                json.dumps(
-                    [
-                        {
-                            "product_id": "123",
-                            "name": "VP Vinyl Record - The Best of 80s",
-                            "quantity": 1,
-                            "unit_price": 25.98,
-                        }
-                    ]
-                ),
-                json.dumps(
-                    [
-                        {
-                            "product_id": "2o972",
-                            "name": "Louis Armstrong Greatest Hits - CD",
-                            "quantity": 1,
-                            "unit_price": 13.45,
-                        }
-                    ]
-                ),
-            ),
+            SAMPLE_ORDERS,
         )
 
-        conn.commit()
+
+def bootstrap():
+    """Create and seed the database unless an up-to-date one already exists."""
+    if not DB_PATH.exists():
+        init_db()
+        populate_sample_data()
+        return
+    # Not a pooled reader: those compile the shared queries on open, which
+    # fails against the older schemas this check is meant to catch.
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != SCHEMA_VERSION:
+        reset_db()
+
+
+def reset_db():
+    """Drop every table and re-create the schema with the sample data."""
+    with get_db(readonly=False) as conn:
+        for table in (
+            "orders",
+            "payment_methods",
+            "addresses",
+            "loyalty_rewards",
+            "customers",
+        ):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+    init_db()
+    populate_sample_data()
 
 
-# Initialize database and sample data
-init_db()
-populate_sample_data()
+if __name__ == "__main__":
+    reset_db()
+    print(f"Database reset: {DB_PATH}")
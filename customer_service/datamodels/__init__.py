@@ -0,0 +1,15 @@
+"""Data models shared by the customer service tools."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RecordModel(BaseModel):
+    """Base for every record built from the database or returned by a tool.
+
+    Records are never mutated after construction, so they are frozen and
+    silently drop unknown keys instead of raising. Pydantic compiles each
+    subclass's validator when the class is created (`defer_build` is off), so
+    no tool call pays a first-use schema build.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from dataclasses import dataclass
+from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import ConfigDict, Field
 
+from . import RecordModel
 
-class ProfileData(BaseModel):
+
+class ProfileData(RecordModel):
     first_name: str
     last_name: str
     phone: str | None = None
@@ -16,32 +19,37 @@ class ProfileData(BaseModel):
     customer_start_date: str | None = None
 
 
-class OrderItem(BaseModel):
+class OrderItem(RecordModel):
+    # Only ever built from stored order JSON, whose keys match exactly.
+    model_config = ConfigDict(extra="forbid")
+
     product_id: str
     name: str
     quantity: int
     unit_price: float | None = None
 
 
-class UserPreferences(BaseModel):
+class UserPreferences(RecordModel):
     language: str
     currency: str
     notifications: bool | None = None
     time_zone: str | None = None
 
 
-class SubscriptionPreferences(BaseModel):
+class SubscriptionPreferences(RecordModel):
     marketing: bool
     newsletters: bool | None = None
     product_updates: bool | None = None
 
 
-class ResetPasswordResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ResetPasswordResponse:
     success: bool
     reset_link: str
 
 
-class PaymentInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PaymentInfo:
     brand: str
     last4: str
     exp_month: int
@@ -49,7 +57,9 @@ class PaymentInfo(BaseModel):
     token: str | None = None
 
 
-class AddressData(BaseModel):
+class AddressData(RecordModel):
+    # Updates and deletes name the address to change.
+    id: str | None = None
     line1: str
     line2: str | None = None
     city: str | None = None
@@ -58,11 +68,20 @@ class AddressData(BaseModel):
     country: str | None = None
 
 
-AddressAction = Literal["add", "update", "delete", "list"]
+AddressAction = Literal["add", "update", "delete"]
 VerificationMethod = Literal["sms", "email", "knowledge"]
+AccountOperationName = Literal[
+    "update_email",
+    "manage_addresses",
+    "manage_email_subscriptions",
+    "update_communication_preferences",
+]
+
 
+class Address(RecordModel):
+    # Only ever built from address rows, whose columns match exactly.
+    model_config = ConfigDict(extra="forbid")
 
-class Address(BaseModel):
     id: str
     line1: str
     line2: str | None = None
@@ -72,7 +91,7 @@ class Address(BaseModel):
     country: str | None = None
 
 
-class PaymentMethod(BaseModel):
+class PaymentMethod(RecordModel):
     id: str
     brand: str
     last4: str
@@ -81,36 +100,43 @@ class PaymentMethod(BaseModel):
     token: str | None = None
 
 
-class Order(BaseModel):
+class Order(RecordModel):
     id: str
     date: str
     total: float
-    items: list[OrderItem] = []
+    items: list[OrderItem] = Field(default_factory=list)
 
 
-class LoyaltyBalance(BaseModel):
+class LoyaltyBalance(RecordModel):
     points: int = 0
     tier: str = "bronze"
-    rewards: list[str] = []
+    rewards: list[str] = Field(default_factory=list)
 
 
-class CustomerRecord(BaseModel):
+class CustomerRecord(RecordModel):
     id: str
     email: str
     profile: ProfileData = ProfileData(first_name="", last_name="")
-    addresses: list[Address] = []
-    payment_methods: list[PaymentMethod] = []
-    orders: list[Order] = []
+    addresses: list[Address] = Field(default_factory=list)
+    payment_methods: list[PaymentMethod] = Field(default_factory=list)
+    orders: list[Order] = Field(default_factory=list)
     loyalty: LoyaltyBalance = LoyaltyBalance()
     preferences: UserPreferences = UserPreferences(language="en", currency="USD")
-    subscriptions: SubscriptionPreferences = {"marketing": True}
+    subscriptions: SubscriptionPreferences = SubscriptionPreferences(marketing=True)
     locked: bool = False
     deleted: bool = False
 
 
-class CommunicationPreferences(BaseModel):
+class CommunicationPreferences(RecordModel):
     """Communication preferences for notifications."""
 
     email: bool
     sms: bool
     push_notifications: bool
+
+
+class AccountOperation(RecordModel):
+    """One account change inside a bulk request."""
+
+    operation: AccountOperationName
+    arguments: dict[str, Any] = Field(default_factory=dict)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
+from . import RecordModel
 from .account import OrderItem
 
 
-class TrackingEvent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TrackingEvent:
     """Single tracking event in order history."""
 
     date: str
@@ -15,7 +17,7 @@ class TrackingEvent(BaseModel):
     location: str
 
 
-class OrderTrackingInfo(BaseModel):
+class OrderTrackingInfo(RecordModel):
     """Order tracking information."""
 
     order_id: str
@@ -26,7 +28,7 @@ class OrderTrackingInfo(BaseModel):
     history: list[TrackingEvent]
 
 
-class OrderCancellationResult(BaseModel):
+class OrderCancellationResult(RecordModel):
     """Result of order cancellation."""
 
     success: bool
@@ -35,7 +37,7 @@ class OrderCancellationResult(BaseModel):
     refund_eta: str
 
 
-class OrderModificationResult(BaseModel):
+class OrderModificationResult(RecordModel):
     """Result of order modification."""
 
     success: bool
@@ -43,7 +45,7 @@ class OrderModificationResult(BaseModel):
     updated_total: float
 
 
-class OrderDetails(BaseModel):
+class OrderDetails(RecordModel):
     """Detailed order information."""
 
     id: str
@@ -55,7 +57,7 @@ class OrderDetails(BaseModel):
     payment_method: str
 
 
-class ShippingOption(BaseModel):
+class ShippingOption(RecordModel):
     """Expedited shipping option."""
 
     method: str
@@ -63,7 +65,7 @@ class ShippingOption(BaseModel):
     delivery: str
 
 
-class DeliveryEstimate(BaseModel):
+class DeliveryEstimate(RecordModel):
     """Delivery estimation information."""
 
     order_id: str
@@ -72,14 +74,14 @@ class DeliveryEstimate(BaseModel):
     expedited_options: list[ShippingOption]
 
 
-class AddressUpdateResult(BaseModel):
+class AddressUpdateResult(RecordModel):
     """Result of address update."""
 
     success: bool
     message: str
 
 
-class ReorderResult(BaseModel):
+class ReorderResult(RecordModel):
     """Result of reordering previous order."""
 
     success: bool
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
+from . import RecordModel
 
-class PaymentMethodResult(BaseModel):
+
+class PaymentMethodResult(RecordModel):
     """Result of adding/removing/updating payment method."""
 
     success: bool
@@ -13,7 +15,7 @@ class PaymentMethodResult(BaseModel):
     payment_method_id: str | None = None
 
 
-class RefundResult(BaseModel):
+class RefundResult(RecordModel):
     """Result of refund processing."""
 
     success: bool
@@ -23,7 +25,7 @@ class RefundResult(BaseModel):
     method: str
 
 
-class Invoice(BaseModel):
+class Invoice(RecordModel):
     """Invoice details."""
 
     invoice_id: str
@@ -37,7 +39,7 @@ class Invoice(BaseModel):
     download_url: str
 
 
-class DisputeResult(BaseModel):
+class DisputeResult(RecordModel):
     """Result of charge dispute."""
 
     success: bool
@@ -46,7 +48,7 @@ class DisputeResult(BaseModel):
     expected_resolution_date: str
 
 
-class PromoCodeResult(BaseModel):
+class PromoCodeResult(RecordModel):
     """Result of applying promo code."""
 
     success: bool
@@ -55,7 +57,8 @@ class PromoCodeResult(BaseModel):
     message: str
 
 
-class BillingRecord(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BillingRecord:
     """Single billing history record."""
 
     date: str
@@ -65,7 +68,7 @@ class BillingRecord(BaseModel):
     invoice_id: str
 
 
-class BillingAddressResult(BaseModel):
+class BillingAddressResult(RecordModel):
     """Result of billing address update."""
 
     success: bool
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
-from pydantic import BaseModel
+from . import RecordModel
 
 
-class ProductBasic(BaseModel):
+class ProductBasic(RecordModel):
     """Basic product information for search results."""
 
     product_id: str
@@ -20,7 +21,8 @@ class ProductBasic(BaseModel):
     image_url: str
 
 
-class ProductSpecifications(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProductSpecifications:
     """Product technical specifications."""
 
     weight: str | None = None
@@ -32,7 +34,7 @@ class ProductSpecifications(BaseModel):
     organic: bool | None = None
 
 
-class ProductDetails(BaseModel):
+class ProductDetails(RecordModel):
     """Detailed product information."""
 
     product_id: str
@@ -49,7 +51,7 @@ class ProductDetails(BaseModel):
     related_products: list[str]
 
 
-class ProductComparison(BaseModel):
+class ProductComparison(RecordModel):
     """Product comparison result."""
 
     products: list[ProductDetails]
@@ -57,7 +59,7 @@ class ProductComparison(BaseModel):
     recommendation: str
 
 
-class ProductReview(BaseModel):
+class ProductReview(RecordModel):
     """Customer product review."""
 
     review_id: str
@@ -70,7 +72,8 @@ class ProductReview(BaseModel):
     helpful_count: int
 
 
-class DeliveryOption(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DeliveryOption:
     """Delivery method option."""
 
     method: str
@@ -78,7 +81,7 @@ class DeliveryOption(BaseModel):
     delivery: str | None = None
 
 
-class ProductAvailability(BaseModel):
+class ProductAvailability(RecordModel):
     """Product availability information."""
 
     available: bool
@@ -89,7 +92,7 @@ class ProductAvailability(BaseModel):
     estimated_delivery: str
 
 
-class ProductRecommendation(BaseModel):
+class ProductRecommendation(RecordModel):
     """Product recommendation with reason."""
 
     product_id: str
@@ -99,7 +102,7 @@ class ProductRecommendation(BaseModel):
     reason: str
 
 
-class ProductSpecDetail(BaseModel):
+class ProductSpecDetail(RecordModel):
     """Detailed product specifications."""
 
     product_id: str
@@ -112,7 +115,7 @@ class ProductSpecDetail(BaseModel):
     warranty: str
 
 
-class ItemAvailability(BaseModel):
+class ItemAvailability(RecordModel):
     """Item availability check result."""
 
     available: bool
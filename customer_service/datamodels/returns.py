@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Literal
 
+from . import RecordModel
+from .support import Priority
 
-class ReturnInitiationResult(BaseModel):
+RefundState = Literal["pending", "processing", "completed", "failed"]
+
+
+class ReturnInitiationResult(RecordModel):
     """Result of return initiation."""
 
     success: bool
@@ -16,7 +22,7 @@ class ReturnInitiationResult(BaseModel):
     refund_eta: str
 
 
-class ReturnEligibility(BaseModel):
+class ReturnEligibility(RecordModel):
     """Return eligibility information."""
 
     eligible: bool
@@ -26,7 +32,8 @@ class ReturnEligibility(BaseModel):
     exceptions: str
 
 
-class ReturnStatusEvent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ReturnStatusEvent:
     """Single return status update event."""
 
     date: str
@@ -34,7 +41,7 @@ class ReturnStatusEvent(BaseModel):
     description: str
 
 
-class ReturnTrackingInfo(BaseModel):
+class ReturnTrackingInfo(RecordModel):
     """Return tracking information."""
 
     return_id: str
@@ -42,19 +49,19 @@ class ReturnTrackingInfo(BaseModel):
     tracking_number: str
     current_location: str
     received_date: str | None
-    refund_status: str
+    refund_status: RefundState
     refund_amount: float
     history: list[ReturnStatusEvent]
 
 
-class ReturnCancellationResult(BaseModel):
+class ReturnCancellationResult(RecordModel):
     """Result of return cancellation."""
 
     success: bool
     message: str
 
 
-class ExchangeResult(BaseModel):
+class ExchangeResult(RecordModel):
     """Result of exchange request."""
 
     success: bool
@@ -65,7 +72,8 @@ class ExchangeResult(BaseModel):
     estimated_delivery: str
 
 
-class RefundBreakdown(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RefundBreakdown:
     """Refund amount breakdown."""
 
     items: float
@@ -74,11 +82,11 @@ class RefundBreakdown(BaseModel):
     total: float
 
 
-class RefundStatus(BaseModel):
+class RefundStatus(RecordModel):
     """Refund status information."""
 
     order_id: str
-    refund_status: str
+    refund_status: RefundState
     refund_amount: float
     refund_method: str
     refund_date: str
@@ -86,7 +94,7 @@ class RefundStatus(BaseModel):
     breakdown: RefundBreakdown
 
 
-class StoreCreditResult(BaseModel):
+class StoreCreditResult(RecordModel):
     """Store credit request result."""
 
     success: bool
@@ -97,17 +105,18 @@ class StoreCreditResult(BaseModel):
     expiration_date: str
 
 
-class EscalationResult(BaseModel):
+class EscalationResult(RecordModel):
     """Return issue escalation result."""
 
     success: bool
     ticket_id: str
     assigned_to: str
-    priority: str
+    priority: Priority
     expected_response: str
 
 
-class ContactInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ContactInfo:
     """Contact information."""
 
     phone: str
@@ -115,7 +124,7 @@ class ContactInfo(BaseModel):
     hours: str
 
 
-class ReturnPolicy(BaseModel):
+class ReturnPolicy(RecordModel):
     """Return policy information."""
 
     return_window_days: int
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Literal
 
+from . import RecordModel
 
-class SupportTicketResult(BaseModel):
+Priority = Literal["low", "medium", "high", "urgent"]
+TicketState = Literal["open", "in_progress", "resolved", "closed"]
+ServiceState = Literal["operational", "degraded", "partial_outage", "major_outage"]
+
+
+class SupportTicketResult(RecordModel):
     """Support ticket creation result."""
 
     success: bool
     ticket_id: str
-    status: str
+    status: TicketState
     assigned_to: str
     created_date: str
     expected_response: str
 
 
-class TroubleshootStep(BaseModel):
+class TroubleshootStep(RecordModel):
     """Individual troubleshooting step."""
 
     step_number: int
@@ -24,7 +31,7 @@ class TroubleshootStep(BaseModel):
     estimated_time: str
 
 
-class TroubleshootingGuide(BaseModel):
+class TroubleshootingGuide(RecordModel):
     """Troubleshooting guide for an issue."""
 
     issue_type: str
@@ -34,15 +41,17 @@ class TroubleshootingGuide(BaseModel):
     escalation_available: bool
 
 
-class ServiceStatus(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ServiceStatus:
     """Individual service status."""
 
     name: str
-    status: str
+    status: ServiceState
     uptime: str
 
 
-class MaintenanceWindow(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MaintenanceWindow:
     """Scheduled maintenance information."""
 
     service: str
@@ -51,17 +60,17 @@ class MaintenanceWindow(BaseModel):
     description: str
 
 
-class SystemStatus(BaseModel):
+class SystemStatus(RecordModel):
     """Overall system status."""
 
-    overall_status: str
+    overall_status: ServiceState
     services: list[ServiceStatus]
     known_issues: list[str]
     scheduled_maintenance: list[MaintenanceWindow]
     last_updated: str
 
 
-class BugReportResult(BaseModel):
+class BugReportResult(RecordModel):
     """Bug report submission result."""
 
     success: bool
@@ -71,7 +80,7 @@ class BugReportResult(BaseModel):
     tracking_url: str
 
 
-class FeatureRequestResult(BaseModel):
+class FeatureRequestResult(RecordModel):
     """Feature request submission result."""
 
     success: bool
@@ -81,12 +90,12 @@ class FeatureRequestResult(BaseModel):
     voting_url: str
 
 
-class TicketStatus(BaseModel):
+class TicketStatus(RecordModel):
     """Support ticket status."""
 
     ticket_id: str
-    status: str
-    priority: str
+    status: TicketState
+    priority: Priority
     subject: str
     created_date: str
     last_updated: str
@@ -95,7 +104,7 @@ class TicketStatus(BaseModel):
     resolution: str | None
 
 
-class TicketUpdateResult(BaseModel):
+class TicketUpdateResult(RecordModel):
     """Ticket update result."""
 
     success: bool
@@ -103,7 +112,7 @@ class TicketUpdateResult(BaseModel):
     updated_at: str
 
 
-class TicketCloseResult(BaseModel):
+class TicketCloseResult(RecordModel):
     """Ticket close result."""
 
     success: bool
@@ -111,7 +120,7 @@ class TicketCloseResult(BaseModel):
     closed_at: str
 
 
-class CallbackResult(BaseModel):
+class CallbackResult(RecordModel):
     """Callback request result."""
 
     success: bool
@@ -1,14 +1,25 @@
 """Global instruction and instruction for the customer service agent."""
 
+import functools
+
 from customer_service.database.database import DEFAULT_CUSTOMER_ID
-from customer_service.tools.account_management import _get_customer_record
+from customer_service.tools.account_management import get_customer_profile_json
 
-GLOBAL_INSTRUCTION = f"""
-The profile of the current customer is:  {_get_customer_record(DEFAULT_CUSTOMER_ID).model_dump_json()}.
+GLOBAL_INSTRUCTION_TEMPLATE = """
+The profile of the current customer is:  {profile}.
 
 If you need more information about the customer's account, orders, payments, products, returns, or technical issues, you can route the request to coordinator agent.
 """
 
+
+@functools.lru_cache(maxsize=1)
+def get_global_instruction() -> str:
+    """Build the global instruction with the current customer's profile."""
+    profile = get_customer_profile_json(DEFAULT_CUSTOMER_ID)
+    # A plain replace, so braces in the profile JSON need no escaping.
+    return GLOBAL_INSTRUCTION_TEMPLATE.replace("{profile}", profile)
+
+
 INSTRUCTION = """
 You are a part of AI customer service agent for "All Time Sound", a e-commerce retailer specializing on vinyl and CD records, merchandise, and high-quality vinyl and CD protection products.
 Always use conversation context/state or tools to get information. Prefer tools over your own internal knowledge.
@@ -23,3 +34,11 @@ You are a coordinator agent that routes customer requests to specialized sub-age
 *   Be proactive in offering help and anticipating customer needs.
 *   Don't output code even if user asks for it.
 """
+
+
+def __getattr__(name: str):
+    # GLOBAL_INSTRUCTION reads the database, so it is built on first access
+    # rather than when the module is imported.
+    if name == "GLOBAL_INSTRUCTION":
+        return get_global_instruction()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 
 """Callback functions for FOMC Research Agent."""
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -11,12 +12,12 @@ from google.adk.models import LlmRequest, LlmResponse
 from google.adk.sessions.state import State
 from google.adk.tools import BaseTool
 from google.adk.tools.tool_context import ToolContext
-from jsonschema import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from customer_service.database.database import DEFAULT_CUSTOMER_ID
 from customer_service.tools.account_management import (
     CustomerRecord,
-    _get_customer_record,
+    get_customer_profile_json,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,52 +26,63 @@ logger.setLevel(logging.DEBUG)
 RATE_LIMIT_SECS = 60
 RPM_QUOTA = 10
 
+COORDINATOR_AGENT_NAME = "customer_service_coordinator"
+TRANSFER_TOOL_NAME = "transfer_to_agent"
 
-def rate_limit_callback(
+# Identifier and email arguments are matched against lowercase values in the
+# database. Free text (address lines, reasons, promo codes) is left as typed.
+LOWERCASE_ARGS = ("customer_id", "order_id", "email", "new_email")
+
+# Validates stored profiles straight from JSON without the BaseModel entry point.
+_CUSTOMER_RECORD_ADAPTER = TypeAdapter(CustomerRecord)
+
+
+async def rate_limit_callback(
     callback_context: CallbackContext, llm_request: LlmRequest
 ) -> None:
     """Callback function that implements a query rate limit.
 
+    Keeps a sliding window of the session's recent request timestamps. Once
+    RPM_QUOTA requests fall inside the last RATE_LIMIT_SECS, the request waits
+    with asyncio.sleep until the oldest one leaves the window, so other
+    sessions on the event loop keep running in the meantime.
+
     Args:
       callback_context: A CallbackContext obj representing the active callback
         context.
       llm_request: A LlmRequest obj representing the active LLM request.
     """
+    # Empty text parts are rejected by the API; only those get rewritten.
     for content in llm_request.contents:
-        for part in content.parts:
-            if part.text == "":
+        for part in content.parts or ():
+            text = part.text
+            if text is not None and not text:
                 part.text = " "
 
+    state = callback_context.state
     now = time.time()
-    if "timer_start" not in callback_context.state:
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-        logger.debug(
-            "rate_limit_callback [timestamp: %i, req_count: 1, elapsed_secs: 0]",
-            now,
-        )
-        return
-
-    request_count = callback_context.state["request_count"] + 1
-    elapsed_secs = now - callback_context.state["timer_start"]
+    window_start = now - RATE_LIMIT_SECS
+    # Session state must stay JSON-serializable, so the window is a plain list.
+    timestamps = [t for t in state.get("request_timestamps", ()) if t > window_start]
     logger.debug(
-        "rate_limit_callback [timestamp: %i, request_count: %i, elapsed_secs: %i]",
+        "rate_limit_callback [timestamp: %i, request_count: %i]",
         now,
-        request_count,
-        elapsed_secs,
+        len(timestamps) + 1,
     )
 
-    if request_count > RPM_QUOTA:
-        delay = RATE_LIMIT_SECS - elapsed_secs + 1
-        if delay > 0:
-            logger.debug("Sleeping for %i seconds", delay)
-            time.sleep(delay)
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-    else:
-        callback_context.state["request_count"] = request_count
+    if len(timestamps) >= RPM_QUOTA:
+        # The window can hold more than RPM_QUOTA entries (a lowered quota, or
+        # concurrent turns of one session); wait on the entry the trim keeps.
+        oldest = timestamps[-RPM_QUOTA]
+        delay = oldest + RATE_LIMIT_SECS - now
+        logger.debug("Sleeping for %.1f seconds", delay)
+        await asyncio.sleep(delay)
+        now = time.time()
+        timestamps = timestamps[len(timestamps) - RPM_QUOTA + 1 :]
 
-    return
+    timestamps.append(now)
+    # Assign a new list so the change is recorded in the session's state delta.
+    state["request_timestamps"] = timestamps
 
 
 def validate_customer_id(customer_id: str, session_state: State) -> tuple[bool, str]:
@@ -86,13 +98,28 @@ def validate_customer_id(customer_id: str, session_state: State) -> tuple[bool,
         When False, a string with the error message to pass to the model for deciding
         what actions to take to remediate.
     """
+    # before_agent stores the profile's id next to it, so the common case is a
+    # plain string compare instead of re-parsing the whole profile.
+    profile_id = session_state.get("customer_id")
+    if profile_id is not None:
+        if customer_id == profile_id:
+            return True, None
+        return (
+            False,
+            "You cannot use the tool with customer_id "
+            + customer_id
+            + ", only for "
+            + profile_id
+            + ".",
+        )
+
     if "customer_profile" not in session_state:
         return False, "No customer profile selected. Please select a profile."
 
     try:
         # We read the profile from the state, where it is set deterministically
         # at the beginning of the session.
-        c = CustomerRecord.model_validate_json(session_state["customer_profile"])
+        c = _CUSTOMER_RECORD_ADAPTER.validate_json(session_state["customer_profile"])
         if customer_id == c.id:
             return True, None
         else:
@@ -111,23 +138,13 @@ def validate_customer_id(customer_id: str, session_state: State) -> tuple[bool,
         )
 
 
-def lowercase_value(value):
-    """Make dictionary lowercase"""
-    if isinstance(value, dict):
-        return (dict(k, lowercase_value(v)) for k, v in value.items())
-    elif isinstance(value, str):
-        return value.lower()
-    elif isinstance(value, (list, set, tuple)):
-        tp = type(value)
-        return tp(lowercase_value(i) for i in value)
-    else:
-        return value
-
-
 # Callback Methods
 def before_tool(tool: BaseTool, args: dict[str, Any], tool_context: CallbackContext):
-    # i make sure all values that the agent is sending to tools are lowercase
-    lowercase_value(args)
+    # i make sure the ids and emails the agent is sending to tools are lowercase
+    for name in LOWERCASE_ARGS:
+        value = args.get(name)
+        if isinstance(value, str):
+            args[name] = value.lower()
 
     # Several tools require customer_id as input. We don't want to rely
     # solely on the model picking the right customer id. We validate it.
@@ -138,15 +155,16 @@ def before_tool(tool: BaseTool, args: dict[str, Any], tool_context: CallbackCont
             return err
 
     # Only for centralized agents: prevent sub-agents from transferring
+    # The tool name is checked first: it is false for almost every call.
     if (
-        tool_context.agent_name != "customer_service_coordinator"
-        and tool.name == "transfer_to_agent"
-        and args.get("agent_name") != "customer_service_coordinator"
+        tool.name == TRANSFER_TOOL_NAME
+        and tool_context.agent_name != COORDINATOR_AGENT_NAME
+        and args.get("agent_name") != COORDINATOR_AGENT_NAME
     ):
         logger.info(
             "Sub-agent trying to transfer to another sub-agent, not allowed. Redirecting to coordinator."
         )
-        args["agent_name"] = "customer_service_coordinator"
+        args["agent_name"] = COORDINATOR_AGENT_NAME
 
     return None
 
@@ -174,9 +192,10 @@ def before_agent(callback_context: InvocationContext):
     # In a production agent, this is set as part of the
     # session creation for the agent.
     if "customer_profile" not in callback_context.state:
-        callback_context.state["customer_profile"] = _get_customer_record(
+        callback_context.state["customer_profile"] = get_customer_profile_json(
             DEFAULT_CUSTOMER_ID
-        ).model_dump_json()
+        )
+        callback_context.state["customer_id"] = DEFAULT_CUSTOMER_ID
         # logger.info(callback_context.state["customer_profile"])
 
 
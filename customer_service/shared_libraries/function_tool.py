@@ -0,0 +1,62 @@
+"""FunctionTool variant shared by the sub-agents."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any, get_args, get_type_hints
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+from pydantic import BaseModel
+
+
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool that does its per-tool introspection once, at registration.
+
+    ADK asks each tool for its FunctionDeclaration on every LLM request, which
+    regenerates the JSON schema of the tool's signature from scratch. The
+    signature never changes at runtime, so the declaration is kept per API
+    variant (Gemini API vs Vertex AI emit slightly different schemas), and the
+    configured variant's is built up front so the first request doesn't pay.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        # FunctionTool calls inspect.signature(func) several times per call.
+        # A pinned __signature__ is returned as is, instead of unwrapping the
+        # offload wrapper and rebuilding the Signature every time.
+        func.__signature__ = inspect.signature(func)
+        super().__init__(func)
+        self._declarations: dict[str, types.FunctionDeclaration | None] = {}
+        self._converts_args = _has_model_params(func)
+        self._get_declaration()
+
+    def _get_declaration(self) -> types.FunctionDeclaration | None:
+        variant = self._api_variant
+        if variant not in self._declarations:
+            self._declarations[variant] = super()._get_declaration()
+        return self._declarations[variant]
+
+    def _preprocess_args(self, args: dict[str, Any]) -> dict[str, Any]:
+        # ADK re-inspects every parameter on each call looking for pydantic
+        # models to build from dict arguments. Tools without any can skip it.
+        if not self._converts_args:
+            return args.copy()
+        return super()._preprocess_args(args)
+
+
+def _has_model_params(func: Callable[..., Any]) -> bool:
+    """Whether any parameter may be converted to a pydantic model by ADK.
+
+    The tool modules use `from __future__ import annotations`, so annotations
+    are resolved with get_type_hints first; a bare string is never a class.
+    Any union member counts, not just Optional[T], so a tool is only sent down
+    the fast path when ADK would not have converted anything either.
+    """
+    hints = get_type_hints(func)
+    hints.pop("return", None)
+    for annotation in hints.values():
+        for candidate in get_args(annotation) or (annotation,):
+            if inspect.isclass(candidate) and issubclass(candidate, BaseModel):
+                return True
+    return False
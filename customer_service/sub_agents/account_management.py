@@ -12,15 +12,19 @@ Responsibilities:
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
+from customer_service.database.database import offload
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.account_management import (
+    bulk_account_ops,
     delete_account,
     get_loyalty_balance,
     manage_addresses,
@@ -39,17 +43,23 @@ account-related requests: updating profile details, changing shipping
 addresses, reviewing loyalty status and points.
 
 Always confirm with the customer before performing updates.
+When several account changes are confirmed at once, apply them with a single
+bulk_account_ops call.
 """
 
 TOOLS = [
-    reset_password,
-    update_email,
-    manage_addresses,
-    get_loyalty_balance,
-    delete_account,
-    unlock_account,
-    verify_identity,
-    manage_email_subscriptions,
+    CachedFunctionTool(offload(tool))
+    for tool in (
+        reset_password,
+        update_email,
+        manage_addresses,
+        get_loyalty_balance,
+        delete_account,
+        unlock_account,
+        verify_identity,
+        manage_email_subscriptions,
+        bulk_account_ops,
+    )
 ]
 
 
@@ -60,7 +70,7 @@ def create_agent(
 
     Args:
             configs: Optional Config object used across the project. If omitted,
-                    a default Config() will be created.
+                    the shared default Config is used.
             name: Optional agent name override.
             model: Optional model override string.
 
@@ -68,14 +78,14 @@ def create_agent(
             google.adk.Agent: configured agent instance.
     """
 
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = "account_management"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
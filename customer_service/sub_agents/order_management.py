@@ -6,14 +6,17 @@ assist with checkout workflows.
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
+from customer_service.database.database import offload
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.order_management import (
     cancel_order,
     change_delivery_address,
@@ -34,13 +37,16 @@ Inform customers about any fees or restrictions related to order modifications.
 """
 
 TOOLS = [
-    track_order,
-    cancel_order,
-    modify_order,
-    get_order_details,
-    estimate_delivery,
-    change_delivery_address,
-    get_order_history,
+    CachedFunctionTool(offload(tool))
+    for tool in (
+        track_order,
+        cancel_order,
+        modify_order,
+        get_order_details,
+        estimate_delivery,
+        change_delivery_address,
+        get_order_history,
+    )
 ]
 
 
@@ -51,21 +57,21 @@ def create_agent(
 
     Args:
         configs: Optional Config object used across the project. If omitted,
-            a default Config() will be created.
+            the shared default Config is used.
         name: Optional agent name override.
         model: Optional model override string.
 
     Returns:
         google.adk.Agent: configured agent instance.
     """
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = name or "order_management"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
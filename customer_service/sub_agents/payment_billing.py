@@ -6,14 +6,17 @@ records operations in CRM.
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
+from customer_service.database.database import offload
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.payment_billing import (
     apply_promo_code,
     dispute_charge,
@@ -35,13 +38,16 @@ Explain all fees, refund timelines, and billing terms clearly.
 """
 
 TOOLS = [
-    remove_payment_method,
-    get_payment_methods,
-    process_refund,
-    get_invoice,
-    dispute_charge,
-    apply_promo_code,
-    get_billing_history,
+    CachedFunctionTool(offload(tool))
+    for tool in (
+        remove_payment_method,
+        get_payment_methods,
+        process_refund,
+        get_invoice,
+        dispute_charge,
+        apply_promo_code,
+        get_billing_history,
+    )
 ]
 
 
@@ -52,21 +58,21 @@ def create_agent(
 
     Args:
         configs: Optional Config object used across the project. If omitted,
-            a default Config() will be created.
+            the shared default Config is used.
         name: Optional agent name override.
         model: Optional model override string.
 
     Returns:
         google.adk.Agent: configured agent instance.
     """
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = name or "payment_billing"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
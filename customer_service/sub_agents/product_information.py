@@ -6,14 +6,16 @@ catalog/stock APIs (mocked in tools.py).
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.product_information import (
     check_item_availability,
     check_product_availability,
@@ -34,12 +36,15 @@ Provide honest information from reviews, both positive and negative aspects.
 """
 
 TOOLS = [
-    search_products,
-    get_product_details,
-    compare_products,
-    check_product_availability,
-    get_product_specifications,
-    check_item_availability,
+    CachedFunctionTool(tool)
+    for tool in (
+        search_products,
+        get_product_details,
+        compare_products,
+        check_product_availability,
+        get_product_specifications,
+        check_item_availability,
+    )
 ]
 
 
@@ -50,21 +55,21 @@ def create_agent(
 
     Args:
             configs: Optional Config object used across the project. If omitted,
-                    a default Config() will be created.
+                    the shared default Config is used.
             name: Optional agent name override.
             model: Optional model override string.
 
     Returns:
             google.adk.Agent: configured agent instance.
     """
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = name or "product_information"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
@@ -6,14 +6,16 @@ facilitates smooth return experiences.
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.returns_refunds import (
     cancel_return,
     check_return_eligibility,
@@ -38,15 +40,18 @@ Be empathetic and understanding about customer concerns.
 """
 
 TOOLS = [
-    initiate_return,
-    check_return_eligibility,
-    track_return,
-    cancel_return,
-    request_exchange,
-    get_refund_status,
-    request_store_credit,
-    escalate_return_issue,
-    get_return_policy,
+    CachedFunctionTool(tool)
+    for tool in (
+        initiate_return,
+        check_return_eligibility,
+        track_return,
+        cancel_return,
+        request_exchange,
+        get_refund_status,
+        request_store_credit,
+        escalate_return_issue,
+        get_return_policy,
+    )
 ]
 
 
@@ -57,21 +62,21 @@ def create_agent(
 
     Args:
         configs: Optional Config object used across the project. If omitted,
-            a default Config() will be created.
+            the shared default Config is used.
         name: Optional agent name override.
         model: Optional model override string.
 
     Returns:
         google.adk.Agent: configured agent instance.
     """
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = name or "returns_refunds"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
@@ -6,14 +6,16 @@ management.
 """
 
 from google.adk import Agent
+from google.genai import types
 
-from customer_service.config import Config
+from customer_service.config import Config, get_config
 from customer_service.shared_libraries.callbacks import (
     after_tool,
     before_agent,
     before_tool,
     rate_limit_callback,
 )
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
 from customer_service.tools.technical_support import (
     check_system_status,
     close_ticket,
@@ -39,15 +41,18 @@ Create support tickets for issues that require specialist attention.
 """
 
 TOOLS = [
-    create_support_ticket,
-    get_troubleshooting_steps,
-    check_system_status,
-    report_bug,
-    request_feature,
-    get_ticket_status,
-    update_ticket,
-    close_ticket,
-    request_callback,
+    CachedFunctionTool(tool)
+    for tool in (
+        create_support_ticket,
+        get_troubleshooting_steps,
+        check_system_status,
+        report_bug,
+        request_feature,
+        get_ticket_status,
+        update_ticket,
+        close_ticket,
+        request_callback,
+    )
 ]
 
 
@@ -58,21 +63,21 @@ def create_agent(
 
     Args:
         configs: Optional Config object used across the project. If omitted,
-            a default Config() will be created.
+            the shared default Config is used.
         name: Optional agent name override.
         model: Optional model override string.
 
     Returns:
         google.adk.Agent: configured agent instance.
     """
-    configs = configs or Config()
+    configs = configs or get_config()
     agent_name = name or "technical_support"
     agent_model = model or configs.agent_settings.model
 
     return Agent(
         model=agent_model,
         description=DESCRIPTION,
-        instruction=INSTRUCTION,
+        static_instruction=types.Content(parts=[types.Part(text=INSTRUCTION)]),
         name=agent_name,
         tools=TOOLS,
         before_tool_callback=before_tool,
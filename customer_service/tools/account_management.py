@@ -2,75 +2,133 @@
 
 from __future__ import annotations
 
-import json
-import uuid
+import functools
+import secrets
+import sqlite3
+from typing import Any
 
 from ..database import database
+from ..datamodels import RecordModel
 from ..datamodels.account import (
+    AccountOperation,
     Address,
     AddressAction,
     AddressData,
     CommunicationPreferences,
     CustomerRecord,
     LoyaltyBalance,
-    Order,
     PaymentMethod,
+    ProfileData,
     SubscriptionPreferences,
+    UserPreferences,
     VerificationMethod,
 )
 
+_ADDRESS_FIELDS = ("line1", "line2", "city", "state", "postal_code", "country")
 
-def _get_customer_record(customer_id: str) -> CustomerRecord | None:
-    """Get a customer record from the database."""
-    with database.get_db() as conn:
-        cursor = conn.cursor()
+# A single SQL text for every insert, so it is parsed once per connection and
+# keys supplied by the model never reach the statement itself. Nothing is
+# inserted unless the customer exists and is not deleted.
+_SQL_INSERT_ADDRESS = (
+    "INSERT INTO addresses (id, customer_id, line1, line2, city, state,"
+    " postal_code, country) SELECT ?, ?, ?, ?, ?, ?, ?, ?"
+    " WHERE EXISTS (SELECT 1 FROM customers WHERE id = ? AND deleted = FALSE)"
+)
 
-        # Get customer data
-        cursor.execute(
-            "SELECT * FROM customers WHERE id = ? AND deleted = FALSE", (customer_id,)
-        )
-        customer = cursor.fetchone()
-        if not customer:
-            return None
+# Restricts address updates and deletes to customers that are not deleted.
+_ACTIVE_OWNER = (
+    "EXISTS (SELECT 1 FROM customers"
+    " WHERE customers.id = addresses.customer_id AND deleted = FALSE)"
+)
 
-        # Get addresses
-        cursor.execute("SELECT * FROM addresses WHERE customer_id = ?", (customer_id,))
-        addresses = [Address(**addr) for addr in cursor.fetchall()]
+# Updates also share one SQL text: each column takes a (provided, value) pair
+# and keeps its current value unless provided, so explicit nulls still clear it.
+_SQL_UPDATE_ADDRESS = (
+    "UPDATE addresses SET "
+    + ", ".join(
+        f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in _ADDRESS_FIELDS
+    )
+    + f" WHERE id = ? AND customer_id = ? AND {_ACTIVE_OWNER}"
+)
 
-        # Get payment methods
-        cursor.execute(
-            "SELECT * FROM payment_methods WHERE customer_id = ?", (customer_id,)
-        )
-        payment_methods = [PaymentMethod(**pm) for pm in cursor.fetchall()]
-
-        # Get orders
-        cursor.execute("SELECT * FROM orders WHERE customer_id = ?", (customer_id,))
-        orders = []
-        for order in cursor.fetchall():
-            items = json.loads(order["items"])
-            orders.append(
-                Order(
-                    id=order["id"],
-                    date=order["date"],
-                    total=order["total"],
-                    items=items,
-                )
-            )
+_SQL_DELETE_ADDRESS = (
+    f"DELETE FROM addresses WHERE id = ? AND customer_id = ? AND {_ACTIVE_OWNER}"
+)
 
-        # Build CustomerRecord
-        return CustomerRecord(
-            id=customer["id"],
-            email=customer["email"],
-            profile=json.loads(customer["profile"]),
-            addresses=addresses,
-            payment_methods=payment_methods,
-            # orders=orders,
-            loyalty=LoyaltyBalance(**json.loads(customer["loyalty"])),
-            preferences=json.loads(customer["preferences"]),
-            subscriptions=json.loads(customer["subscriptions"]),
-            locked=customer["locked"],
-            deleted=customer["deleted"],
-        )
+
+def _as_dict(value: Any) -> Any:
+    """Return a model argument as the dict of keys the caller actually sent.
+
+    Depending on its version, ADK passes model-typed arguments either as the
+    raw JSON dict or as the model built from it; the tools read them as dicts.
+    """
+    if isinstance(value, RecordModel):
+        return value.model_dump(exclude_unset=True)
+    return value
+
+
+def _get_customer_record(customer_id: str) -> CustomerRecord | None:
+    """Get a customer record, cached until the next write to the database.
+
+    Records are frozen, so one instance can be shared between callers.
+    """
+    return _load_customer_record(customer_id, database.write_generation())
+
+
+@functools.lru_cache(maxsize=256)
+def _load_customer_record(customer_id: str, generation: int) -> CustomerRecord | None:
+    customer = database.fetch_customer_bundle(customer_id)
+    if not customer:
+        return None
+
+    # Build CustomerRecord
+    return CustomerRecord(
+        id=customer["id"],
+        email=customer["email"],
+        profile=ProfileData(
+            first_name=customer["first_name"],
+            last_name=customer["last_name"],
+            phone=customer["phone"],
+            birthdate=customer["birthdate"],
+            account_number=customer["account_number"],
+            customer_start_date=customer["customer_start_date"],
+        ),
+        addresses=[Address(**addr) for addr in customer["addresses"]],
+        payment_methods=[PaymentMethod(**pm) for pm in customer["payment_methods"]],
+        loyalty=LoyaltyBalance(
+            points=customer["loyalty_points"],
+            tier=customer["loyalty_tier"],
+            rewards=customer["rewards"],
+        ),
+        preferences=UserPreferences(
+            language=customer["language"],
+            currency=customer["currency"],
+            notifications=customer["notifications"],
+            time_zone=customer["time_zone"],
+        ),
+        subscriptions=SubscriptionPreferences(
+            marketing=customer["marketing_opt_in"],
+            newsletters=customer["newsletters_opt_in"],
+            product_updates=customer["product_updates_opt_in"],
+        ),
+        locked=customer["locked"],
+        deleted=customer["deleted"],
+    )
+
+
+def get_customer_profile_json(customer_id: str) -> str | None:
+    """Return the customer's record as JSON, serialized once per database state.
+
+    The prompt and every new session embed the same profile, so it is cached
+    until the next write to the database.
+    """
+    return _customer_profile_json(customer_id, database.write_generation())
+
+
+@functools.lru_cache(maxsize=32)
+def _customer_profile_json(customer_id: str, generation: int) -> str | None:
+    record = _get_customer_record(customer_id)
+    return record.model_dump_json() if record else None
 
 
 def reset_password(email: str) -> dict:
@@ -96,7 +154,7 @@ def reset_password(email: str) -> dict:
         customer = cursor.fetchone()
 
         if customer:
-            token = str(uuid.uuid4())
+            token = secrets.token_urlsafe(16)
             link = (
                 f"https://example.com/reset-password?token={token}&uid={customer['id']}"
             )
@@ -116,11 +174,12 @@ def update_email(customer_id: str, new_email: str) -> bool:
     Returns:
         bool: True if email was updated successfully, False if customer not found or account deleted
     """
-    with database.get_db() as conn:
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE customers SET email = ? WHERE id = ? AND deleted = FALSE",
-            (new_email, customer_id),
+            # Emails are stored lowercased; reset_password looks them up that way.
+            (new_email.lower(), customer_id),
         )
         # conn.commit()
         return cursor.rowcount > 0
@@ -131,65 +190,57 @@ def manage_addresses(
 ) -> bool:
     """Manage addresses for a customer.
 
-    action: 'add', 'update', 'delete', 'list'
+    action: 'add', 'update', 'delete'
     For 'add' provide address_data (fields for Address except id).
     For 'update' provide address_data with 'id' and fields to update.
     For 'delete' provide address_data with 'id'.
-    For 'list' address_data is ignored and returns True (addresses kept in DB).
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
+    action = action.lower()
+    address_data = _as_dict(address_data)
 
-        # Check if customer exists and is not deleted
-        cursor.execute(
-            "SELECT 1 FROM customers WHERE id = ? AND deleted = FALSE", (customer_id,)
-        )
-        if not cursor.fetchone():
-            return False
-
-        action = action.lower()
+    # Each mutation checks the customer inside its own statement, so it is a
+    # single autocommitted write with no separate existence query.
+    with database.get_db(readonly=False) as conn:
+        cursor = conn.cursor()
         if action == "add" and address_data:
-            aid = address_data.get("id") or f"addr-{uuid.uuid4()}"
-            fields = {k: v for k, v in address_data.items() if k != "id"}
-            fields["customer_id"] = customer_id
-            fields["id"] = aid
-
-            placeholders = ", ".join("?" * len(fields))
-            columns = ", ".join(fields.keys())
-            values = tuple(fields.values())
-
+            aid = address_data.get("id") or f"addr-{secrets.token_hex(16)}"
             cursor.execute(
-                f"INSERT INTO addresses ({columns}) VALUES ({placeholders})", values
+                _SQL_INSERT_ADDRESS,
+                (
+                    aid,
+                    customer_id,
+                    *(address_data.get(field) for field in _ADDRESS_FIELDS),
+                    customer_id,
+                ),
             )
-            return True
+            return cursor.rowcount > 0
 
         elif action == "update" and address_data and "id" in address_data:
-            updates = {k: v for k, v in address_data.items() if k != "id"}
-            if not updates:
+            if not any(field in address_data for field in _ADDRESS_FIELDS):
                 return False
 
-            set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-            values = (*updates.values(), address_data["id"], customer_id)
-
             cursor.execute(
-                f"UPDATE addresses SET {set_clause} WHERE id = ? AND customer_id = ?",
-                values,
+                _SQL_UPDATE_ADDRESS,
+                (
+                    *(
+                        value
+                        for field in _ADDRESS_FIELDS
+                        for value in (field in address_data, address_data.get(field))
+                    ),
+                    address_data["id"],
+                    customer_id,
+                ),
             )
             return cursor.rowcount > 0
 
         elif action == "delete" and address_data and "id" in address_data:
-            cursor.execute(
-                "DELETE FROM addresses WHERE id = ? AND customer_id = ?",
-                (address_data["id"], customer_id),
-            )
+            cursor.execute(_SQL_DELETE_ADDRESS, (address_data["id"], customer_id))
             return cursor.rowcount > 0
 
-        elif action == "list":
-            return True
-
         return False
 
 
+@database.cached_read
 def get_loyalty_balance(customer_id: str) -> LoyaltyBalance:
     """Get customer's loyalty program status and points.
 
@@ -203,13 +254,20 @@ def get_loyalty_balance(customer_id: str) -> LoyaltyBalance:
     with database.get_db() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT loyalty FROM customers WHERE id = ? AND deleted = FALSE",
+            "SELECT loyalty_points, loyalty_tier FROM customers WHERE id = ? AND deleted = FALSE",
             (customer_id,),
         )
         result = cursor.fetchone()
         if result:
-            loyalty_data = json.loads(result["loyalty"])
-            return LoyaltyBalance(**loyalty_data)
+            cursor.execute(
+                "SELECT reward FROM loyalty_rewards WHERE customer_id = ?",
+                (customer_id,),
+            )
+            return LoyaltyBalance(
+                points=result["loyalty_points"],
+                tier=result["loyalty_tier"],
+                rewards=[row["reward"] for row in cursor],
+            )
     return LoyaltyBalance()
 
 
@@ -227,7 +285,7 @@ def delete_account(customer_id: str, confirmation: bool) -> bool:
     if not confirmation:
         return False
 
-    with database.get_db() as conn:
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE customers SET deleted = TRUE WHERE id = ?", (customer_id,)
@@ -245,7 +303,7 @@ def unlock_account(customer_id: str) -> bool:
         bool: True if account was unlocked successfully, False if customer not found
         or account deleted
     """
-    with database.get_db() as conn:
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE customers SET locked = FALSE WHERE id = ? AND deleted = FALSE",
@@ -269,9 +327,7 @@ def verify_identity(
     """
     with database.get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM customers WHERE id = ? AND deleted = FALSE", (customer_id,)
-        )
+        cursor.execute(database.SQL_CUSTOMER_EXISTS, (customer_id,))
         if not cursor.fetchone():
             return False
         # In a real system we'd call an identity provider. Here we fake success.
@@ -292,11 +348,21 @@ def manage_email_subscriptions(
         bool: True if preferences were updated successfully, False if customer not found
         or account deleted
     """
-    with database.get_db() as conn:
+    preferences = _as_dict(preferences)
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE customers SET subscriptions = ? WHERE id = ? AND deleted = FALSE",
-            (json.dumps(preferences), customer_id),
+            """
+            UPDATE customers
+            SET marketing_opt_in = ?, newsletters_opt_in = ?, product_updates_opt_in = ?
+            WHERE id = ? AND deleted = FALSE
+            """,
+            (
+                preferences.get("marketing", True),
+                preferences.get("newsletters"),
+                preferences.get("product_updates"),
+                customer_id,
+            ),
         )
         return cursor.rowcount > 0
 
@@ -315,10 +381,65 @@ def update_communication_preferences(
         bool: True if preferences were updated successfully, False if customer not found
         or account deleted
     """
-    with database.get_db() as conn:
+    preferences = _as_dict(preferences)
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE customers SET communication_preferences = ? WHERE id = ? AND deleted = FALSE",
-            (json.dumps(preferences), customer_id),
+            """
+            UPDATE customers
+            SET comm_email = ?, comm_sms = ?, comm_push = ?
+            WHERE id = ? AND deleted = FALSE
+            """,
+            (
+                preferences.get("email", True),
+                preferences.get("sms", True),
+                preferences.get("push_notifications", True),
+                customer_id,
+            ),
         )
         return cursor.rowcount > 0
+
+
+_BULK_OPERATIONS = {
+    "update_email": update_email,
+    "manage_addresses": manage_addresses,
+    "manage_email_subscriptions": manage_email_subscriptions,
+    "update_communication_preferences": update_communication_preferences,
+}
+
+
+def bulk_account_ops(
+    customer_id: str, operations: list[AccountOperation]
+) -> list[bool]:
+    """Apply several account changes for one customer in a single call.
+
+    Use this instead of separate tool calls when the customer asks for more than
+    one independent change. All operations share one database transaction.
+
+    Args:
+        customer_id: The ID of the customer account
+        operations: Changes to apply in order. Each has an 'operation' naming one
+            of update_email, manage_addresses, manage_email_subscriptions or
+            update_communication_preferences, and 'arguments' holding that tool's
+            arguments other than customer_id
+
+    Returns:
+        list[bool]: The result of each operation, in order. An operation with an
+        unknown name, invalid arguments or a database error reports False and
+        its changes are undone; the other operations still apply
+    """
+    results = []
+    with database.transaction() as conn:
+        for op in operations:
+            # Each operation gets a savepoint so a failure only undoes itself.
+            conn.execute("SAVEPOINT bulk_op")
+            try:
+                op = _as_dict(op)
+                func = _BULK_OPERATIONS.get(op.get("operation"))
+                ok = func is not None and func(customer_id, **op.get("arguments", {}))
+            except (AttributeError, TypeError, sqlite3.Error):
+                conn.execute("ROLLBACK TO bulk_op")
+                ok = False
+            conn.execute("RELEASE bulk_op")
+            results.append(bool(ok))
+    return results
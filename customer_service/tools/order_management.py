@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 
 from ..database import database
 from ..datamodels.account import Order, OrderItem
@@ -17,7 +17,20 @@ from ..datamodels.orders import (
     TrackingEvent,
 )
 
+# Mock data shared by every call; the records are frozen.
+_MOCK_TRACKING_HISTORY = (
+    TrackingEvent(date="2025-10-24", status="Order placed", location="Online"),
+    TrackingEvent(date="2025-10-25", status="Processing", location="Warehouse"),
+    TrackingEvent(date="2025-10-26", status="Shipped", location="Distribution Center"),
+)
+
+_MOCK_EXPEDITED_OPTIONS = (
+    ShippingOption(method="Next Day Air", cost=25.00, delivery="2025-10-26"),
+    ShippingOption(method="2-Day Express", cost=15.00, delivery="2025-10-27"),
+)
 
+
+@database.cached_read
 def get_order_history(customer_id: str) -> list[Order]:
     """Get customer's complete order history.
 
@@ -32,19 +45,14 @@ def get_order_history(customer_id: str) -> list[Order]:
         cursor = conn.cursor()
 
         # Check if customer exists and is not deleted
-        cursor.execute(
-            "SELECT 1 FROM customers WHERE id = ? AND deleted = FALSE", (customer_id,)
-        )
+        cursor.execute(database.SQL_CUSTOMER_EXISTS, (customer_id,))
         if not cursor.fetchone():
             return []
 
-        cursor.execute(
-            "SELECT * FROM orders WHERE customer_id = ? ORDER BY date DESC",
-            (customer_id,),
-        )
+        cursor.execute(database.SQL_ORDERS_BY_CUSTOMER, (customer_id,))
         orders = []
-        for order in cursor.fetchall():
-            items = json.loads(order["items"])
+        for order in cursor:
+            items = orjson.loads(order["items"])
             orders.append(
                 Order(
                     id=order["id"],
@@ -65,33 +73,20 @@ def track_order(order_id: str) -> OrderTrackingInfo | None:
     Returns:
         OrderTrackingInfo containing order tracking details, or None if order not found
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return None
-
-        # Mock tracking data
-        return OrderTrackingInfo(
-            order_id=order_id,
-            status="shipped",
-            tracking_number=f"TRACK{order_id[-6:].upper()}",
-            estimated_delivery="2025-10-28",
-            current_location="Distribution Center - Your City",
-            history=[
-                TrackingEvent(
-                    date="2025-10-24", status="Order placed", location="Online"
-                ),
-                TrackingEvent(
-                    date="2025-10-25", status="Processing", location="Warehouse"
-                ),
-                TrackingEvent(
-                    date="2025-10-26", status="Shipped", location="Distribution Center"
-                ),
-            ],
-        )
+    order = database.fetch_order(order_id)
+
+    if not order:
+        return None
+
+    # Mock tracking data
+    return OrderTrackingInfo(
+        order_id=order_id,
+        status="shipped",
+        tracking_number=f"TRACK{order_id[-6:].upper()}",
+        estimated_delivery="2025-10-28",
+        current_location="Distribution Center - Your City",
+        history=_MOCK_TRACKING_HISTORY,
+    )
 
 
 def cancel_order(order_id: str, reason: str) -> OrderCancellationResult:
@@ -104,27 +99,24 @@ def cancel_order(order_id: str, reason: str) -> OrderCancellationResult:
     Returns:
         OrderCancellationResult with cancellation details
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return OrderCancellationResult(
-                success=False,
-                message="Order not found",
-                refund_amount=0.0,
-                refund_eta="",
-            )
+    order = database.fetch_order(order_id)
 
-        # Mock cancellation logic - in reality check if shipped
+    if not order:
         return OrderCancellationResult(
-            success=True,
-            message="Order cancelled successfully",
-            refund_amount=order["total"],
-            refund_eta="3-5 business days",
+            success=False,
+            message="Order not found",
+            refund_amount=0.0,
+            refund_eta="",
         )
 
+    # Mock cancellation logic - in reality check if shipped
+    return OrderCancellationResult(
+        success=True,
+        message="Order cancelled successfully",
+        refund_amount=order["total"],
+        refund_eta="3-5 business days",
+    )
+
 
 def modify_order(order_id: str, modifications: dict) -> OrderModificationResult:
     """Modify an order before it ships (change items, address, etc.).
@@ -139,23 +131,20 @@ def modify_order(order_id: str, modifications: dict) -> OrderModificationResult:
     Returns:
         OrderModificationResult with modification details
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
+    order = database.fetch_order(order_id)
 
-        if not order:
-            return OrderModificationResult(
-                success=False, message="Order not found", updated_total=0.0
-            )
-
-        # Mock modification - would update DB in reality
+    if not order:
         return OrderModificationResult(
-            success=True,
-            message="Order modified successfully",
-            updated_total=order["total"],
+            success=False, message="Order not found", updated_total=0.0
         )
 
+    # Mock modification - would update DB in reality
+    return OrderModificationResult(
+        success=True,
+        message="Order modified successfully",
+        updated_total=order["total"],
+    )
+
 
 def get_order_details(order_id: str) -> OrderDetails | None:
     """Get detailed information about a specific order.
@@ -166,26 +155,23 @@ def get_order_details(order_id: str) -> OrderDetails | None:
     Returns:
         OrderDetails with complete order information, or None if not found
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return None
-
-        items = json.loads(order["items"])
-        order_items = [OrderItem(**item) for item in items]
-
-        return OrderDetails(
-            id=order["id"],
-            date=order["date"],
-            status="processing",
-            items=order_items,
-            total=order["total"],
-            shipping_address="123 Garden Lane, Greenfield, CA 90210",
-            payment_method="Visa ending in 4242",
-        )
+    order = database.fetch_order(order_id)
+
+    if not order:
+        return None
+
+    items = orjson.loads(order["items"])
+    order_items = [OrderItem(**item) for item in items]
+
+    return OrderDetails(
+        id=order["id"],
+        date=order["date"],
+        status="processing",
+        items=order_items,
+        total=order["total"],
+        shipping_address="123 Garden Lane, Greenfield, CA 90210",
+        payment_method="Visa ending in 4242",
+    )
 
 
 def estimate_delivery(order_id: str) -> DeliveryEstimate | None:
@@ -197,27 +183,17 @@ def estimate_delivery(order_id: str) -> DeliveryEstimate | None:
     Returns:
         DeliveryEstimate with delivery information, or None if order not found
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return None
-
-        return DeliveryEstimate(
-            order_id=order_id,
-            estimated_date="2025-10-28",
-            estimated_time_window="9 AM - 5 PM",
-            expedited_options=[
-                ShippingOption(
-                    method="Next Day Air", cost=25.00, delivery="2025-10-26"
-                ),
-                ShippingOption(
-                    method="2-Day Express", cost=15.00, delivery="2025-10-27"
-                ),
-            ],
-        )
+    order = database.fetch_order(order_id)
+
+    if not order:
+        return None
+
+    return DeliveryEstimate(
+        order_id=order_id,
+        estimated_date="2025-10-28",
+        estimated_time_window="9 AM - 5 PM",
+        expedited_options=_MOCK_EXPEDITED_OPTIONS,
+    )
 
 
 def change_delivery_address(order_id: str, new_address: dict) -> AddressUpdateResult:
@@ -236,15 +212,12 @@ def change_delivery_address(order_id: str, new_address: dict) -> AddressUpdateRe
     Returns:
         AddressUpdateResult with update status
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
+    order = database.fetch_order(order_id)
 
-        if not order:
-            return AddressUpdateResult(success=False, message="Order not found")
+    if not order:
+        return AddressUpdateResult(success=False, message="Order not found")
 
-        # Mock address update
-        return AddressUpdateResult(
-            success=True, message="Delivery address updated successfully"
-        )
+    # Mock address update
+    return AddressUpdateResult(
+        success=True, message="Delivery address updated successfully"
+    )
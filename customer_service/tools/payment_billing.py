@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 
+import orjson
+
 from ..database import database
 from ..datamodels.account import PaymentMethod
 from ..datamodels.payments import (
@@ -29,7 +30,7 @@ def remove_payment_method(
     Returns:
         PaymentMethodResult with removal status
     """
-    with database.get_db() as conn:
+    with database.get_db(readonly=False) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM payment_methods WHERE id = ? AND customer_id = ?",
@@ -47,6 +48,7 @@ def remove_payment_method(
         )
 
 
+@database.cached_read
 def get_payment_methods(customer_id: str) -> list[PaymentMethod]:
     """Get all payment methods for a customer.
 
@@ -59,11 +61,8 @@ def get_payment_methods(customer_id: str) -> list[PaymentMethod]:
     """
     with database.get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM payment_methods WHERE customer_id = ?", (customer_id,)
-        )
-        methods = cursor.fetchall()
-        return [PaymentMethod(**m) for m in methods]
+        cursor.execute(database.SQL_PAYMENT_METHODS_BY_CUSTOMER, (customer_id,))
+        return [PaymentMethod(**m) for m in cursor]
 
 
 def process_refund(
@@ -79,27 +78,24 @@ def process_refund(
     Returns:
         RefundResult with refund processing details
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return RefundResult(
-                success=False, refund_id="", amount=0.0, estimated_arrival="", method=""
-            )
-
-        refund_amount = amount if amount is not None else order["total"]
-        refund_id = f"refund-{uuid.uuid4()}"
+    order = database.fetch_order(order_id)
 
+    if not order:
         return RefundResult(
-            success=True,
-            refund_id=refund_id,
-            amount=refund_amount,
-            estimated_arrival="3-5 business days",
-            method="Original payment method",
+            success=False, refund_id="", amount=0.0, estimated_arrival="", method=""
         )
 
+    refund_amount = amount if amount is not None else order["total"]
+    refund_id = f"refund-{uuid.uuid4()}"
+
+    return RefundResult(
+        success=True,
+        refund_id=refund_id,
+        amount=refund_amount,
+        estimated_arrival="3-5 business days",
+        method="Original payment method",
+    )
+
 
 def get_invoice(order_id: str) -> Invoice | None:
     """Retrieve invoice details for an order.
@@ -110,30 +106,27 @@ def get_invoice(order_id: str) -> Invoice | None:
     Returns:
         Invoice with complete invoice details, or None if order not found
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return None
-
-        items = json.loads(order["items"])
-        subtotal = order["total"] * 0.85  # Mock calculation
-        tax = order["total"] * 0.10
-        shipping = order["total"] * 0.05
-
-        return Invoice(
-            invoice_id=f"INV-{order_id}",
-            order_id=order_id,
-            date=order["date"],
-            items=items,
-            subtotal=round(subtotal, 2),
-            tax=round(tax, 2),
-            shipping=round(shipping, 2),
-            total=order["total"],
-            download_url=f"https://example.com/invoices/{order_id}.pdf",
-        )
+    order = database.fetch_order(order_id)
+
+    if not order:
+        return None
+
+    items = orjson.loads(order["items"])
+    subtotal = order["total"] * 0.85  # Mock calculation
+    tax = order["total"] * 0.10
+    shipping = order["total"] * 0.05
+
+    return Invoice(
+        invoice_id=f"INV-{order_id}",
+        order_id=order_id,
+        date=order["date"],
+        items=items,
+        subtotal=round(subtotal, 2),
+        tax=round(tax, 2),
+        shipping=round(shipping, 2),
+        total=order["total"],
+        download_url=f"https://example.com/invoices/{order_id}.pdf",
+    )
 
 
 def dispute_charge(order_id: str, reason: str, details: str) -> DisputeResult:
@@ -147,25 +140,22 @@ def dispute_charge(order_id: str, reason: str, details: str) -> DisputeResult:
     Returns:
         DisputeResult with dispute filing details
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return DisputeResult(
-                success=False, dispute_id="", status="", expected_resolution_date=""
-            )
-
-        dispute_id = f"dispute-{uuid.uuid4()}"
+    order = database.fetch_order(order_id)
 
+    if not order:
         return DisputeResult(
-            success=True,
-            dispute_id=dispute_id,
-            status="under_review",
-            expected_resolution_date="2025-11-15",
+            success=False, dispute_id="", status="", expected_resolution_date=""
         )
 
+    dispute_id = f"dispute-{uuid.uuid4()}"
+
+    return DisputeResult(
+        success=True,
+        dispute_id=dispute_id,
+        status="under_review",
+        expected_resolution_date="2025-11-15",
+    )
+
 
 def apply_promo_code(order_id: str, promo_code: str) -> PromoCodeResult:
     """Apply a promotional code to an order.
@@ -177,51 +167,50 @@ def apply_promo_code(order_id: str, promo_code: str) -> PromoCodeResult:
     Returns:
         PromoCodeResult with promo code application details
     """
-    with database.get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM orders WHERE id = ?", (order_id,))
-        order = cursor.fetchone()
-
-        if not order:
-            return PromoCodeResult(
-                success=False,
-                discount_amount=0.0,
-                new_total=0.0,
-                message="Order not found",
-            )
+    order = database.fetch_order(order_id)
 
-        # Mock promo code validation
-        valid_codes = {
-            "SAVE10": {"type": "percentage", "value": 10},
-            "SAVE20": {"type": "percentage", "value": 20},
-            "FREESHIP": {"type": "free_shipping", "value": 0},
-        }
-
-        if promo_code not in valid_codes:
-            return PromoCodeResult(
-                success=False,
-                discount_amount=0.0,
-                new_total=order["total"],
-                message="Invalid promo code",
-            )
+    if not order:
+        return PromoCodeResult(
+            success=False,
+            discount_amount=0.0,
+            new_total=0.0,
+            message="Order not found",
+        )
 
-        promo = valid_codes[promo_code]
-        if promo["type"] == "percentage":
-            discount = order["total"] * (promo["value"] / 100)
-            new_total = order["total"] - discount
-            message = f"{promo['value']}% off applied"
-        else:
-            discount = 5.00  # Mock shipping cost
-            new_total = order["total"] - discount
-            message = "Free shipping applied"
+    # Mock promo code validation
+    valid_codes = {
+        "SAVE10": {"type": "percentage", "value": 10},
+        "SAVE20": {"type": "percentage", "value": 20},
+        "FREESHIP": {"type": "free_shipping", "value": 0},
+    }
 
+    # Codes are case-insensitive: "save10" and "SAVE10" are the same code.
+    promo_code = promo_code.upper()
+    if promo_code not in valid_codes:
         return PromoCodeResult(
-            success=True,
-            discount_amount=round(discount, 2),
-            new_total=round(new_total, 2),
-            message=message,
+            success=False,
+            discount_amount=0.0,
+            new_total=order["total"],
+            message="Invalid promo code",
         )
 
+    promo = valid_codes[promo_code]
+    if promo["type"] == "percentage":
+        discount = order["total"] * (promo["value"] / 100)
+        new_total = order["total"] - discount
+        message = f"{promo['value']}% off applied"
+    else:
+        discount = 5.00  # Mock shipping cost
+        new_total = order["total"] - discount
+        message = "Free shipping applied"
+
+    return PromoCodeResult(
+        success=True,
+        discount_amount=round(discount, 2),
+        new_total=round(new_total, 2),
+        message=message,
+    )
+
 
 def get_billing_history(customer_id: str, months: int = 6) -> list[BillingRecord]:
     """Get customer's billing history.
@@ -235,14 +224,9 @@ def get_billing_history(customer_id: str, months: int = 6) -> list[BillingRecord
     """
     with database.get_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM orders WHERE customer_id = ? ORDER BY date DESC",
-            (customer_id,),
-        )
-        orders = cursor.fetchall()
-
+        cursor.execute(database.SQL_ORDERS_BY_CUSTOMER, (customer_id,))
         billing_records = []
-        for order in orders:
+        for order in cursor:
             billing_records.append(
                 BillingRecord(
                     date=order["date"],
@@ -12,56 +12,42 @@ from ..datamodels.products import (
     ProductSpecifications,
 )
 
-
-def search_products(
-    query: str, category: str | None = None, max_results: int = 10
-) -> list[ProductBasic]:
-    """Search for products by name, description, or category.
-
-    Args:
-        query: Search term or keyword
-        category: Optional category filter ()
-        max_results: Maximum number of results to return (default: 10)
-
-    Returns:
-        List of ProductBasic objects with product information
-    """
-    # Mock product catalog
-    products = [
-        ProductBasic(
-            product_id="123",
-            name="VP Vinyl Record - The Best of 80s",
-            description="High-quality vinyl record featuring the best hits of the 1980s.",
-            price=25.98,
-            category="vinyl",
-            in_stock=True,
-            rating=4.5,
-            image_url="https://example.com/products/123.jpg",
-        ),
-        ProductBasic(
-            product_id="2o972",
-            name="Louis Armstrong Greatest Hits - CD",
-            description="A collection of the greatest hits by Louis Armstrong.",
-            price=13.45,
-            category="cd",
-            in_stock=True,
-            rating=4.3,
-            image_url="https://example.com/products/2o972.jpg",
-        ),
-        ProductBasic(
-            product_id="028789",
-            name="Protection file for Vinyl Records",
-            description="10 sleeves. Keep your vinyl records safe and scratch-free with these protective sleeves.",
-            price=2.50,
-            category="accessories",
-            in_stock=True,
-            rating=4.7,
-            image_url="https://example.com/products/028789.jpg",
-        ),
-        ProductBasic(
-            product_id="jh1888",
-            name="Hozier (10th Anniversary) Custard Colour 2LP",
-            description="""Side A
+# Mock product catalog, built once at import.
+_CATALOG: tuple[ProductBasic, ...] = (
+    ProductBasic(
+        product_id="123",
+        name="VP Vinyl Record - The Best of 80s",
+        description="High-quality vinyl record featuring the best hits of the 1980s.",
+        price=25.98,
+        category="vinyl",
+        in_stock=True,
+        rating=4.5,
+        image_url="https://example.com/products/123.jpg",
+    ),
+    ProductBasic(
+        product_id="2o972",
+        name="Louis Armstrong Greatest Hits - CD",
+        description="A collection of the greatest hits by Louis Armstrong.",
+        price=13.45,
+        category="cd",
+        in_stock=True,
+        rating=4.3,
+        image_url="https://example.com/products/2o972.jpg",
+    ),
+    ProductBasic(
+        product_id="028789",
+        name="Protection file for Vinyl Records",
+        description="10 sleeves. Keep your vinyl records safe and scratch-free with these protective sleeves.",
+        price=2.50,
+        category="accessories",
+        in_stock=True,
+        rating=4.7,
+        image_url="https://example.com/products/028789.jpg",
+    ),
+    ProductBasic(
+        product_id="jh1888",
+        name="Hozier (10th Anniversary) Custard Colour 2LP",
+        description="""Side A
 1. Take Me To Church
 2. Angel of Small Death & The Codeine Scene
 3. Jackie and Wilson
@@ -85,88 +71,63 @@ Side D
 2. Run
 3. Arsonist's Lullabye
 4. My Love Will Never Die""",
-            price=34.99,
-            category="vinyl",
-            in_stock=False,
-            rating=4.6,
-            image_url="https://example.com/products/jh1888.jpg",
-        ),
-    ]
-
-    # Filter by category if provided
-    if category:
-        products = [p for p in products if p.category.lower() == category.lower()]
-
-    # Simple search by query
-    query_lower = query.lower()
-    results = [
-        p
-        for p in products
-        if query_lower in p.name.lower() or query_lower in p.description.lower()
-    ]
-
-    return results[:max_results]
-
-
-def get_product_details(product_id: str) -> ProductDetails | None:
-    """Get detailed information about a specific product.
-
-    Args:
-        product_id: The unique identifier of the product
+        price=34.99,
+        category="vinyl",
+        in_stock=False,
+        rating=4.6,
+        image_url="https://example.com/products/jh1888.jpg",
+    ),
+)
 
-    Returns:
-        ProductDetails with complete product information, or None if not found
-    """
-    # Mock product database
-    products_data = {
-        "soil-123": {
-            "product_id": "soil-123",
-            "name": "Premium Organic Potting Soil",
-            "description": "High-quality organic potting mix perfect for indoor and outdoor plants. "
-            "Contains coconut coir, perlite, and aged compost for optimal drainage and nutrition.",
-            "price": 25.98,
-            "category": "soil",
-            "in_stock": True,
-            "stock_quantity": 150,
-            "rating": 4.5,
-            "reviews_count": 342,
-            "specifications": {
-                "weight": "20 lbs",
-                "volume": "1.5 cubic feet",
-                "ph_level": "6.0-7.0",
-                "organic": True,
-            },
-            "images": [
-                "https://example.com/products/soil-123-1.jpg",
-                "https://example.com/products/soil-123-2.jpg",
-            ],
-            "related_products": ["soil-124", "fertilizer-456"],
+# Mock product database
+_PRODUCTS_DATA = {
+    "soil-123": {
+        "product_id": "soil-123",
+        "name": "Premium Organic Potting Soil",
+        "description": "High-quality organic potting mix perfect for indoor and outdoor plants. "
+        "Contains coconut coir, perlite, and aged compost for optimal drainage and nutrition.",
+        "price": 25.98,
+        "category": "soil",
+        "in_stock": True,
+        "stock_quantity": 150,
+        "rating": 4.5,
+        "reviews_count": 342,
+        "specifications": {
+            "weight": "20 lbs",
+            "volume": "1.5 cubic feet",
+            "ph_level": "6.0-7.0",
+            "organic": True,
         },
-        "fertilizer-456": {
-            "product_id": "fertilizer-456",
-            "name": "All-Purpose Plant Fertilizer",
-            "description": "Balanced 10-10-10 NPK fertilizer suitable for all plant types.",
-            "price": 15.99,
-            "category": "fertilizer",
-            "in_stock": True,
-            "stock_quantity": 75,
-            "rating": 4.3,
-            "reviews_count": 189,
-            "specifications": {
-                "npk_ratio": "10-10-10",
-                "weight": "5 lbs",
-                "coverage": "2,500 sq ft",
-                "organic": False,
-            },
-            "images": ["https://example.com/products/fertilizer-456.jpg"],
-            "related_products": ["soil-123", "fertilizer-457"],
+        "images": [
+            "https://example.com/products/soil-123-1.jpg",
+            "https://example.com/products/soil-123-2.jpg",
+        ],
+        "related_products": ["soil-124", "fertilizer-456"],
+    },
+    "fertilizer-456": {
+        "product_id": "fertilizer-456",
+        "name": "All-Purpose Plant Fertilizer",
+        "description": "Balanced 10-10-10 NPK fertilizer suitable for all plant types.",
+        "price": 15.99,
+        "category": "fertilizer",
+        "in_stock": True,
+        "stock_quantity": 75,
+        "rating": 4.3,
+        "reviews_count": 189,
+        "specifications": {
+            "npk_ratio": "10-10-10",
+            "weight": "5 lbs",
+            "coverage": "2,500 sq ft",
+            "organic": False,
         },
-    }
+        "images": ["https://example.com/products/fertilizer-456.jpg"],
+        "related_products": ["soil-123", "fertilizer-457"],
+    },
+}
 
-    product_data = products_data.get(product_id)
-    if not product_data:
-        return None
 
+def _build_product(product_data: dict) -> ProductDetails:
+    """Build a ProductDetails model from a mock product database entry."""
     return ProductDetails(
         product_id=product_data["product_id"],
         name=product_data["name"],
@@ -183,6 +144,63 @@ def get_product_details(product_id: str) -> ProductDetails | None:
     )
 
 
+# Lowercased name and description of each catalog product, for search, plus
+# the same entries bucketed by lowercased category.
+_SEARCH_INDEX = tuple((p, f"{p.name}\n{p.description}".lower()) for p in _CATALOG)
+_SEARCH_BY_CATEGORY = {
+    category: tuple(e for e in _SEARCH_INDEX if e[0].category.lower() == category)
+    for category in {p.category.lower() for p in _CATALOG}
+}
+
+# Products are static, so they are validated once and served from memory.
+_PRODUCTS = {pid: _build_product(data) for pid, data in _PRODUCTS_DATA.items()}
+
+# Mock inventory
+_INVENTORY = {
+    "soil-123": 150,
+    "fertilizer-456": 75,
+    "seeds-789": 200,
+    "tools-101": 50,
+}
+
+
+def search_products(
+    query: str, category: str | None = None, max_results: int = 10
+) -> list[ProductBasic]:
+    """Search for products by name, description, or category.
+
+    Args:
+        query: Search term or keyword
+        category: Optional category filter ()
+        max_results: Maximum number of results to return (default: 10)
+
+    Returns:
+        List of ProductBasic objects with product information
+    """
+    # Filter by category if provided
+    entries = (
+        _SEARCH_BY_CATEGORY.get(category.lower(), ()) if category else _SEARCH_INDEX
+    )
+
+    # Simple search by query
+    query_lower = query.lower()
+    results = [p for p, text in entries if query_lower in text]
+
+    return results[:max_results]
+
+
+def get_product_details(product_id: str) -> ProductDetails | None:
+    """Get detailed information about a specific product.
+
+    Args:
+        product_id: The unique identifier of the product
+
+    Returns:
+        ProductDetails with complete product information, or None if not found
+    """
+    return _PRODUCTS.get(product_id)
+
+
 def compare_products(product_ids: list[str]) -> ProductComparison:
     """Compare multiple products side by side.
 
@@ -288,15 +306,7 @@ def check_item_availability(product_id: str, quantity: int = 1) -> ItemAvailabil
     Returns:
         ItemAvailability with availability details
     """
-    # Mock inventory check
-    inventory = {
-        "soil-123": 150,
-        "fertilizer-456": 75,
-        "seeds-789": 200,
-        "tools-101": 50,
-    }
-
-    available_qty = inventory.get(product_id, 0)
+    available_qty = _INVENTORY.get(product_id, 0)
 
     return ItemAvailability(
         available=available_qty >= quantity,
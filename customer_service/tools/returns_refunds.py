@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import uuid
 from datetime import datetime, timedelta
 
@@ -233,6 +234,7 @@ def escalate_return_issue(return_id: str, issue_description: str) -> EscalationR
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_return_policy() -> ReturnPolicy:
     """Get detailed information about the return policy.
 
@@ -10,6 +10,7 @@ from customer_service.datamodels.support import (
     CallbackResult,
     FeatureRequestResult,
     MaintenanceWindow,
+    Priority,
     ServiceStatus,
     SupportTicketResult,
     SystemStatus,
@@ -22,7 +23,7 @@ from customer_service.datamodels.support import (
 
 
 def create_support_ticket(
-    customer_id: str, issue_type: str, description: str, priority: str = "medium"
+    customer_id: str, issue_type: str, description: str, priority: Priority = "medium"
 ) -> SupportTicketResult:
     """Create a technical support ticket.
 
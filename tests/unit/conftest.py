@@ -0,0 +1,25 @@
+import pytest
+
+from customer_service.database import database
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the data layer's pools at an empty temp directory."""
+    path = tmp_path / "customer_service.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    monkeypatch.setattr(
+        database,
+        "_READERS",
+        database._ConnectionPool(database.READER_POOL_SIZE, readonly=True),
+    )
+    monkeypatch.setattr(database, "_WRITER", database._ConnectionPool(1))
+    yield path
+    database.close_pool()
+
+
+@pytest.fixture
+def db(db_path):
+    """A freshly seeded database."""
+    database.bootstrap()
+    return database
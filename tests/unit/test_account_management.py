@@ -0,0 +1,142 @@
+import sqlite3
+
+import pytest
+
+from customer_service.database.database import DEFAULT_CUSTOMER_ID
+from customer_service.tools import account_management
+
+
+def _email(db, customer_id=DEFAULT_CUSTOMER_ID):
+    with db.get_db() as conn:
+        return conn.execute(
+            "SELECT email FROM customers WHERE id = ?", (customer_id,)
+        ).fetchone()["email"]
+
+
+def _address_lines(db, customer_id=DEFAULT_CUSTOMER_ID):
+    with db.get_db() as conn:
+        rows = conn.execute(
+            "SELECT line1 FROM addresses WHERE customer_id = ?", (customer_id,)
+        )
+        return sorted(row["line1"] for row in rows)
+
+
+@pytest.fixture
+def other_customer(db):
+    with db.get_db(readonly=False) as conn:
+        conn.execute(
+            "INSERT INTO customers (id, email) VALUES ('cust-2', 'bob@example.com')"
+        )
+        conn.execute(
+            "INSERT INTO addresses (id, customer_id, line1)"
+            " VALUES ('addr-2', 'cust-2', '9 Other Rd')"
+        )
+    return "cust-2"
+
+
+def test_bulk_account_ops_reports_failed_operations(db, other_customer):
+    results = account_management.bulk_account_ops(
+        DEFAULT_CUSTOMER_ID,
+        [
+            # Duplicate email: sqlite3.IntegrityError.
+            {
+                "operation": "update_email",
+                "arguments": {"new_email": "bob@example.com"},
+            },
+            {
+                "operation": "manage_addresses",
+                "arguments": {"action": "add", "address_data": {"line1": "1 Main St"}},
+            },
+            # Not a dict: AttributeError.
+            "update_email",
+            {"operation": "update_email", "arguments": {"unknown": True}},
+        ],
+    )
+
+    assert results == [False, True, False, False]
+    assert _email(db) == "alice@example.com"
+    assert _address_lines(db) == ["1 Main St", "123 Garden Lane"]
+
+
+def test_bulk_account_ops_rolls_back_only_the_failed_operation(db, monkeypatch):
+    def update_then_fail(customer_id, new_email):
+        account_management.update_email(customer_id, new_email)
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setitem(
+        account_management._BULK_OPERATIONS, "update_email", update_then_fail
+    )
+    results = account_management.bulk_account_ops(
+        DEFAULT_CUSTOMER_ID,
+        [
+            {
+                "operation": "manage_addresses",
+                "arguments": {"action": "add", "address_data": {"line1": "1 Main St"}},
+            },
+            {
+                "operation": "update_email",
+                "arguments": {"new_email": "new@example.com"},
+            },
+        ],
+    )
+
+    assert results == [True, False]
+    assert _email(db) == "alice@example.com"
+    assert _address_lines(db) == ["1 Main St", "123 Garden Lane"]
+
+
+def test_bulk_account_ops_rolls_back_batch_on_unexpected_error(db, monkeypatch):
+    def fail(customer_id):
+        raise RuntimeError
+
+    monkeypatch.setitem(account_management._BULK_OPERATIONS, "update_email", fail)
+    with pytest.raises(RuntimeError):
+        account_management.bulk_account_ops(
+            DEFAULT_CUSTOMER_ID,
+            [
+                {
+                    "operation": "manage_addresses",
+                    "arguments": {
+                        "action": "add",
+                        "address_data": {"line1": "1 Main St"},
+                    },
+                },
+                {"operation": "update_email"},
+            ],
+        )
+
+    assert _address_lines(db) == ["123 Garden Lane"]
+
+
+def test_partial_address_update_keeps_omitted_fields(db):
+    assert account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "update", {"id": "addr-1", "city": "Springfield"}
+    )
+    assert account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "update", {"id": "addr-1", "state": None}
+    )
+
+    (address,) = account_management._get_customer_record(DEFAULT_CUSTOMER_ID).addresses
+    assert address.line1 == "123 Garden Lane"
+    assert address.city == "Springfield"
+    assert address.state is None
+    assert address.postal_code == "90210"
+
+
+def test_address_changes_require_the_owning_customer(db, other_customer):
+    assert not account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "update", {"id": "addr-2", "line1": "Taken over"}
+    )
+    assert not account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "delete", {"id": "addr-2"}
+    )
+    assert _address_lines(db, other_customer) == ["9 Other Rd"]
+
+
+def test_add_address_for_deleted_customer_inserts_nothing(db):
+    assert account_management.delete_account(DEFAULT_CUSTOMER_ID, confirmation=True)
+
+    assert not account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "add", {"line1": "1 Main St"}
+    )
+    assert _address_lines(db) == ["123 Garden Lane"]
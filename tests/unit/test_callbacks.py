@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+
+from customer_service.shared_libraries import callbacks
+from customer_service.tools.payment_billing import apply_promo_code
+
+
+def test_before_tool_keeps_promo_code_usable(db):
+    tool = SimpleNamespace(name="apply_promo_code")
+    tool_context = SimpleNamespace(state={}, agent_name="payment_billing_agent")
+    args = {"order_id": "ORD-1", "promo_code": "SAVE10"}
+
+    assert callbacks.before_tool(tool, args, tool_context) is None
+    assert args == {"order_id": "ord-1", "promo_code": "SAVE10"}
+
+    result = apply_promo_code(**args)
+    assert result.success
+    assert result.message == "10% off applied"
+
+
+def test_rate_limit_sleeps_once_the_window_is_full(monkeypatch):
+    clock = [1000.0]
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(callbacks.time, "time", lambda: clock[0])
+    monkeypatch.setattr(callbacks.asyncio, "sleep", fake_sleep)
+    context = SimpleNamespace(state={})
+    request = SimpleNamespace(contents=[])
+
+    async def send(count):
+        for _ in range(count):
+            await callbacks.rate_limit_callback(context, request)
+            clock[0] += 1
+
+    asyncio.run(send(callbacks.RPM_QUOTA))
+    assert sleeps == []
+
+    asyncio.run(send(1))
+    # The oldest request, sent at 1000, leaves the window at 1060.
+    assert sleeps == [1000 + callbacks.RATE_LIMIT_SECS - (1000 + callbacks.RPM_QUOTA)]
+    timestamps = context.state["request_timestamps"]
+    assert len(timestamps) == callbacks.RPM_QUOTA
+    assert timestamps[0] == 1001
+    assert timestamps[-1] == 1000 + callbacks.RATE_LIMIT_SECS
+
+    clock[0] += callbacks.RATE_LIMIT_SECS
+    asyncio.run(send(1))
+    assert len(sleeps) == 1
+    assert context.state["request_timestamps"] == [clock[0] - 1]
+
+
+def test_rate_limit_waits_on_the_quota_entry_when_over_quota(monkeypatch):
+    now = 1000.0
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(callbacks.time, "time", lambda: now)
+    monkeypatch.setattr(callbacks.asyncio, "sleep", fake_sleep)
+    # Two more in-window entries than the quota allows, one per second.
+    timestamps = [now - 50 + i for i in range(callbacks.RPM_QUOTA + 2)]
+    context = SimpleNamespace(state={"request_timestamps": timestamps})
+
+    asyncio.run(callbacks.rate_limit_callback(context, SimpleNamespace(contents=[])))
+
+    # Only the newest RPM_QUOTA - 1 entries are kept, so the wait ends when
+    # the one just before them leaves the window, not the very oldest one.
+    assert sleeps == [
+        timestamps[-callbacks.RPM_QUOTA] + callbacks.RATE_LIMIT_SECS - now
+    ]
+    assert context.state["request_timestamps"] == [
+        *timestamps[-callbacks.RPM_QUOTA + 1 :],
+        now,
+    ]
@@ -0,0 +1,54 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from customer_service.database import database
+from customer_service.database.database import DEFAULT_CUSTOMER_ID
+from customer_service.tools import account_management
+
+
+def test_write_invalidates_cached_reads(db):
+    assert account_management.get_loyalty_balance(DEFAULT_CUSTOMER_ID).points == 120
+    record = account_management._get_customer_record(DEFAULT_CUSTOMER_ID)
+    assert record.email == "alice@example.com"
+
+    with db.get_db(readonly=False) as conn:
+        conn.execute(
+            "UPDATE customers SET loyalty_points = 500, email = 'new@example.com'"
+            " WHERE id = ?",
+            (DEFAULT_CUSTOMER_ID,),
+        )
+
+    assert account_management.get_loyalty_balance(DEFAULT_CUSTOMER_ID).points == 500
+    record = account_management._get_customer_record(DEFAULT_CUSTOMER_ID)
+    assert record.email == "new@example.com"
+
+
+def test_transaction_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError), db.transaction():
+        assert account_management.update_email(DEFAULT_CUSTOMER_ID, "new@example.com")
+        raise RuntimeError
+
+    with db.get_db() as conn:
+        (email,) = conn.execute(
+            "SELECT email FROM customers WHERE id = ?", (DEFAULT_CUSTOMER_ID,)
+        ).fetchone()
+    assert email == "alice@example.com"
+
+
+def test_reader_connections_reject_writes(db):
+    with db.get_db() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM customers")
+
+
+def test_bootstrap_rebuilds_old_schema(db_path):
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("CREATE TABLE customers (id TEXT PRIMARY KEY, email TEXT)")
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+
+    database.bootstrap()
+
+    bundle = database.fetch_customer_bundle(DEFAULT_CUSTOMER_ID)
+    assert bundle["rewards"] == ["5%_off_next_purchase"]
@@ -0,0 +1,21 @@
+from customer_service.database import database
+from customer_service.database.database import DEFAULT_CUSTOMER_ID
+from customer_service.datamodels.account import AddressData
+from customer_service.shared_libraries.function_tool import CachedFunctionTool
+from customer_service.tools import account_management, order_management
+
+
+def test_model_params_are_detected_through_string_annotations():
+    assert CachedFunctionTool(account_management.manage_addresses)._converts_args
+    assert CachedFunctionTool(
+        database.offload(account_management.bulk_account_ops)
+    )._converts_args
+    assert not CachedFunctionTool(order_management.get_order_details)._converts_args
+
+
+def test_tools_accept_model_arguments(db):
+    assert account_management.manage_addresses(
+        DEFAULT_CUSTOMER_ID, "add", AddressData(line1="1 Main St")
+    )
+    record = account_management._get_customer_record(DEFAULT_CUSTOMER_ID)
+    assert [a.line1 for a in record.addresses] == ["123 Garden Lane", "1 Main St"]